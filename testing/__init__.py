@@ -0,0 +1 @@
+"""PowerAutomation 测试包"""
@@ -0,0 +1 @@
+"""PowerAutomation 自动化测试框架"""
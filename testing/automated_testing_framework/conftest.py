@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+PowerAutomation 测试框架根级pytest配置
+
+注册全框架通用的命令行选项与标记，并在pytest控制进程中执行
+只需进行一次的会话级准备（各xdist worker不重复执行）
+"""
+
+import pytest
+
+from testing.automated_testing_framework.test_preconditions import publish_shared_gpu_probe
+
+def pytest_addoption(parser):
+    """注册命令行选项"""
+    parser.addoption("--runslow", action="store_true", default=False, help="运行标记为slow的测试（访问外部网站的视觉测试等）")
+
+def pytest_configure(config):
+    """注册自定义标记（未安装pytest-xdist时避免未知标记警告）
+    
+    控制进程（或未启用xdist的单进程会话）还会探测一次GPU并通过共享内存提供给各worker
+    """
+    config.addinivalue_line("markers", "xdist_group(name): 并行执行时将同组测试分配到同一worker")
+    config.addinivalue_line("markers", "slow: 耗时较长的测试，需通过 --runslow 显式启用")
+    
+    if not hasattr(config, "workerinput"):
+        publish_shared_gpu_probe()
+
+def pytest_collection_modifyitems(config, items):
+    """未指定 --runslow 时跳过slow测试"""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="需要 --runslow 选项才会运行")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
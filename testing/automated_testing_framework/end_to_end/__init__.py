@@ -0,0 +1 @@
+"""PowerAutomation 端到端测试模块"""
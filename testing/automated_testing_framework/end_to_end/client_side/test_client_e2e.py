@@ -5,13 +5,13 @@ PowerAutomation 客户端端到端测试
 测试客户端功能的端到端流程
 """
 
+from __future__ import annotations
+
+from typing import Any, Dict
+
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, DESKTOP_PLATFORMS, STANDARD_RESOURCES
 
 class TestClientSideE2E:
     """客户端端到端测试"""
@@ -19,21 +19,12 @@ class TestClientSideE2E:
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "CLIENT_E2E_001",
-            "test_name": "客户端端到端测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos"],
-                    "preferred_platforms": ["windows"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 8,
-                    "min_cpu_cores": 4,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="CLIENT_E2E_001",
+            test_name="客户端端到端测试",
+            preconditions={
+                "platform": DESKTOP_PLATFORMS,
+                "resources": STANDARD_RESOURCES,
                 "capabilities": ["ui_test", "automation_test"],
                 "environment": {
                     "os_version": "Windows 10+ / macOS 12.0+",
@@ -41,12 +32,14 @@ class TestClientSideE2E:
                 },
                 "dependencies": ["automation_engine", "ui_framework"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, validator):
+        """每个测试方法前验证前置条件"""
+        self.validator = validator
+        validation_result = self.validator.validate_preconditions_cached(
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
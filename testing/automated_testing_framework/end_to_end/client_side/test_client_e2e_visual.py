@@ -6,66 +6,57 @@ PowerAutomation 客户端端到端视觉测试
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from enhanced_test_preconditions import EnhancedPreconditionValidator
-from powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+from testing.automated_testing_framework.powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, ALL_PLATFORMS, BASIC_RESOURCES
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("visual")
 class TestClientSideE2EVisual:
     """客户端端到端视觉测试"""
     
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = EnhancedPreconditionValidator()
         cls.visual_config = VisualTestConfig(
             browser_type="chromium",
             headless=True,
             visual_threshold=0.05
         )
         cls.visual_tester = PowerAutomationVisualTester(config=cls.visual_config)
+        cls.visual_tester.preload_baselines()
         
-        cls.test_config = {
-            "test_id": "CLIENT_E2E_VISUAL_001",
-            "test_name": "客户端端到端视觉测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos", "linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 4,
-                    "min_cpu_cores": 2,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="CLIENT_E2E_VISUAL_001",
+            test_name="客户端端到端视觉测试",
+            preconditions={
+                "platform": ALL_PLATFORMS,
+                "resources": BASIC_RESOURCES,
                 "capabilities": ["ui_test", "automation_test", "visual_test"],
                 "environment": {
                     "browser_support": "chromium"
                 },
                 "dependencies": ["playwright", "automation_engine"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, request, enhanced_validator):
+        """每个测试方法前验证前置条件并创建浏览器上下文"""
+        self.validator = enhanced_validator
         validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
             pytest.skip(f"前置条件不满足: {validation_result['reason']}")
         
-        # 启动视觉测试浏览器
-        if not self.visual_tester.start_browser():
-            pytest.skip("视觉测试浏览器启动失败")
-    
-    def teardown_method(self):
-        """每个测试方法后的清理"""
-        self.visual_tester.stop_browser()
+        # 复用会话级浏览器，每个测试只创建独立的上下文
+        self.page = self.visual_tester.new_context(request.getfixturevalue("visual_browser"))
+        
+        yield
+        
+        self.page.context.close()
     
     def test_client_ui_visual_verification(self):
         """测试客户端UI视觉验证"""
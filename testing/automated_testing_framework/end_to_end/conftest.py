@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+PowerAutomation 端到端测试共享夹具
+
+前置条件验证器和视觉测试浏览器在整个pytest会话中只创建一次，
+由各端到端测试类通过夹具注入复用
+"""
+
+import pytest
+
+from testing.automated_testing_framework.test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.enhanced_test_preconditions import EnhancedPreconditionValidator
+
+@pytest.fixture(scope="session")
+def validator() -> PreconditionValidator:
+    """会话级前置条件验证器"""
+    return PreconditionValidator()
+
+@pytest.fixture(scope="session")
+def enhanced_validator() -> EnhancedPreconditionValidator:
+    """会话级增强前置条件验证器"""
+    return EnhancedPreconditionValidator()
+
+@pytest.fixture(scope="session")
+def visual_browser():
+    """会话级视觉测试浏览器（整个会话只启动一次，各测试仅创建独立上下文）"""
+    from testing.automated_testing_framework.powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+    
+    browser_owner = PowerAutomationVisualTester(config=VisualTestConfig(browser_type="chromium", headless=True))
+    if not browser_owner.start_browser():
+        browser_owner.stop_browser()
+        pytest.skip("视觉测试浏览器启动失败")
+    
+    yield browser_owner.browser
+    
+    browser_owner.stop_browser()
@@ -39,6 +39,9 @@ class EndToEndTestManager:
         print("🏗️ 初始化端到端测试结构...")
         
         try:
+            # 创建共享前置条件模板
+            self._create_precondition_templates()
+            
             # 创建客户端测试
             self._create_client_side_tests()
             
@@ -48,6 +51,9 @@ class EndToEndTestManager:
             # 创建集成测试
             self._create_integration_tests()
             
+            # 创建共享测试夹具
+            self._create_e2e_conftest()
+            
             # 创建端到端测试配置
             self._create_e2e_config()
             
@@ -61,6 +67,72 @@ class EndToEndTestManager:
             print(f"❌ 端到端测试结构初始化失败: {e}")
             return False
     
+    def _create_precondition_templates(self):
+        """创建共享前置条件模板"""
+        templates_content = '''#!/usr/bin/env python3
+"""
+PowerAutomation 端到端测试前置条件模板
+
+各端到端测试类共用的测试配置结构与平台、资源要求，
+平台与资源要求以只读映射形式在模块级别只创建一次
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict
+
+@dataclass(frozen=True, slots=True)
+class E2ETestConfig:
+    """端到端测试类配置"""
+    test_id: str
+    test_name: str
+    preconditions: Dict[str, Any]
+
+# 平台要求
+ALL_PLATFORMS = MappingProxyType({
+    "required_platforms": ["windows", "macos", "linux"],
+    "preferred_platforms": ["linux"],
+    "excluded_platforms": []
+})
+
+DESKTOP_PLATFORMS = MappingProxyType({
+    "required_platforms": ["windows", "macos"],
+    "preferred_platforms": ["windows"],
+    "excluded_platforms": []
+})
+
+LINUX_PLATFORMS = MappingProxyType({
+    "required_platforms": ["linux"],
+    "preferred_platforms": ["linux"],
+    "excluded_platforms": []
+})
+
+# 资源要求
+BASIC_RESOURCES = MappingProxyType({
+    "min_memory_gb": 4,
+    "min_cpu_cores": 2,
+    "gpu_required": False
+})
+
+STANDARD_RESOURCES = MappingProxyType({
+    "min_memory_gb": 8,
+    "min_cpu_cores": 4,
+    "gpu_required": False
+})
+
+HIGH_RESOURCES = MappingProxyType({
+    "min_memory_gb": 16,
+    "min_cpu_cores": 8,
+    "gpu_required": False
+})
+'''
+        
+        templates_path = self.e2e_dir / "precondition_templates.py"
+        with open(templates_path, 'w', encoding='utf-8') as f:
+            f.write(templates_content)
+        
+        print(f"✅ 创建前置条件模板: {templates_path}")
+    
     def _create_client_side_tests(self):
         """创建客户端测试"""
         client_test_content = '''#!/usr/bin/env python3
@@ -70,13 +142,13 @@ PowerAutomation 客户端端到端测试
 测试客户端功能的端到端流程
 """
 
+from __future__ import annotations
+
+from typing import Any, Dict
+
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, DESKTOP_PLATFORMS, STANDARD_RESOURCES
 
 class TestClientSideE2E:
     """客户端端到端测试"""
@@ -84,21 +156,12 @@ class TestClientSideE2E:
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "CLIENT_E2E_001",
-            "test_name": "客户端端到端测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos"],
-                    "preferred_platforms": ["windows"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 8,
-                    "min_cpu_cores": 4,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="CLIENT_E2E_001",
+            test_name="客户端端到端测试",
+            preconditions={
+                "platform": DESKTOP_PLATFORMS,
+                "resources": STANDARD_RESOURCES,
                 "capabilities": ["ui_test", "automation_test"],
                 "environment": {
                     "os_version": "Windows 10+ / macOS 12.0+",
@@ -106,12 +169,14 @@ class TestClientSideE2E:
                 },
                 "dependencies": ["automation_engine", "ui_framework"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, validator):
+        """每个测试方法前验证前置条件"""
+        self.validator = validator
+        validation_result = self.validator.validate_preconditions_cached(
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
@@ -188,13 +253,13 @@ PowerAutomation 服务端端到端测试
 测试服务端功能的端到端流程
 """
 
+from __future__ import annotations
+
+from typing import Any, Dict
+
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, LINUX_PLATFORMS, HIGH_RESOURCES
 
 class TestServerSideE2E:
     """服务端端到端测试"""
@@ -202,21 +267,12 @@ class TestServerSideE2E:
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "SERVER_E2E_001",
-            "test_name": "服务端端到端测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 16,
-                    "min_cpu_cores": 8,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="SERVER_E2E_001",
+            test_name="服务端端到端测试",
+            preconditions={
+                "platform": LINUX_PLATFORMS,
+                "resources": HIGH_RESOURCES,
                 "capabilities": ["api_test", "data_test", "performance_test"],
                 "environment": {
                     "database": "PostgreSQL 14+",
@@ -225,12 +281,14 @@ class TestServerSideE2E:
                 },
                 "dependencies": ["database_engine", "cache_system", "api_gateway"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, validator):
+        """每个测试方法前验证前置条件"""
+        self.validator = validator
+        validation_result = self.validator.validate_preconditions_cached(
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
@@ -307,13 +365,13 @@ PowerAutomation 集成端到端测试
 测试客户端和服务端的集成流程
 """
 
+from __future__ import annotations
+
+from typing import Any, Dict
+
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, ALL_PLATFORMS, HIGH_RESOURCES
 
 class TestIntegrationE2E:
     """集成端到端测试"""
@@ -321,21 +379,12 @@ class TestIntegrationE2E:
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "INTEGRATION_E2E_001",
-            "test_name": "集成端到端测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos", "linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 16,
-                    "min_cpu_cores": 8,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="INTEGRATION_E2E_001",
+            test_name="集成端到端测试",
+            preconditions={
+                "platform": ALL_PLATFORMS,
+                "resources": HIGH_RESOURCES,
                 "capabilities": ["integration_test", "api_test", "ui_test"],
                 "environment": {
                     "network": "stable",
@@ -343,12 +392,14 @@ class TestIntegrationE2E:
                 },
                 "dependencies": ["client_app", "server_api", "database"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, validator):
+        """每个测试方法前验证前置条件"""
+        self.validator = validator
+        validation_result = self.validator.validate_preconditions_cached(
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
@@ -414,6 +465,52 @@ if __name__ == "__main__":
         
         print(f"✅ 创建集成测试: {integration_test_path}")
     
+    def _create_e2e_conftest(self):
+        """创建端到端测试共享夹具"""
+        conftest_content = '''#!/usr/bin/env python3
+"""
+PowerAutomation 端到端测试共享夹具
+
+前置条件验证器和视觉测试浏览器在整个pytest会话中只创建一次，
+由各端到端测试类通过夹具注入复用
+"""
+
+import pytest
+
+from testing.automated_testing_framework.test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.enhanced_test_preconditions import EnhancedPreconditionValidator
+
+@pytest.fixture(scope="session")
+def validator() -> PreconditionValidator:
+    """会话级前置条件验证器"""
+    return PreconditionValidator()
+
+@pytest.fixture(scope="session")
+def enhanced_validator() -> EnhancedPreconditionValidator:
+    """会话级增强前置条件验证器"""
+    return EnhancedPreconditionValidator()
+
+@pytest.fixture(scope="session")
+def visual_browser():
+    """会话级视觉测试浏览器（整个会话只启动一次，各测试仅创建独立上下文）"""
+    from testing.automated_testing_framework.powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+    
+    browser_owner = PowerAutomationVisualTester(config=VisualTestConfig(browser_type="chromium", headless=True))
+    if not browser_owner.start_browser():
+        browser_owner.stop_browser()
+        pytest.skip("视觉测试浏览器启动失败")
+    
+    yield browser_owner.browser
+    
+    browser_owner.stop_browser()
+'''
+        
+        conftest_path = self.e2e_dir / "conftest.py"
+        with open(conftest_path, 'w', encoding='utf-8') as f:
+            f.write(conftest_content)
+        
+        print(f"✅ 创建共享测试夹具: {conftest_path}")
+    
     def _create_e2e_config(self):
         """创建端到端测试配置"""
         e2e_config = {
@@ -487,6 +584,28 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+try:
+    import xdist
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
+
+def _dump_json_report(data: Dict[str, Any], path: Path):
+    """写入JSON报告（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 class E2ETestRunner:
     """端到端测试运行器"""
     
@@ -557,11 +676,17 @@ class E2ETestRunner:
             str(test_dir),
             "-v",
             "--tb=short",
-            "--capture=no",
-            f"--html={report_file}",
-            "--self-contained-html"
+            f"--html={report_file}"
         ]
         
+        # 仅在CI环境中生成自包含HTML报告
+        if os.environ.get("CI"):
+            pytest_args.append("--self-contained-html")
+        
+        # 安装pytest-xdist时并行执行（视觉测试通过xdist_group固定在同一worker）
+        if XDIST_AVAILABLE:
+            pytest_args.extend(["-n", "auto", "--dist=loadgroup"])
+        
         try:
             start_time = datetime.now()
             result = pytest.main(pytest_args)
@@ -620,9 +745,7 @@ class E2ETestRunner:
         
         # 保存JSON报告
         json_report_path = self.report_dir / f"e2e_comprehensive_report_{timestamp}.json"
-        import json
-        with open(json_report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        _dump_json_report(report_data, json_report_path)
         
         print(f"\\n📊 综合报告已生成: {json_report_path}")
 
@@ -7,22 +7,51 @@ PowerAutomation 端到端测试基类
 
 import unittest
 import asyncio
+import platform
 import yaml
+from functools import cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, FrozenSet
 from dataclasses import dataclass
 
-@dataclass
+# 优先使用libyaml的C实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 端到端测试配置与截图目录（模块导入时计算一次）
+_BASE_DIR = Path(__file__).parent
+_CONFIG_PATH = _BASE_DIR / "configs" / "e2e_config.yaml"
+_SCREENSHOT_DIR = _BASE_DIR / "screenshots"
+
+# 当前平台（进程内不会变化，模块导入时检测一次）
+_SYSTEM = platform.system().lower()
+_CURRENT_PLATFORM = "macos" if _SYSTEM == "darwin" else _SYSTEM
+
+@cache
+def _system_resources() -> tuple:
+    """系统内存(GB)与CPU核心数（首次资源检查时采集，之后复用）"""
+    import psutil
+    return psutil.virtual_memory().total / (1024**3), psutil.cpu_count()
+
+@dataclass(slots=True)
 class E2EPreconditions:
     """端到端测试前置条件"""
-    required_platforms: List[str]
-    preferred_platforms: List[str]
-    excluded_platforms: List[str]
+    required_platforms: FrozenSet[str]
+    preferred_platforms: FrozenSet[str]
+    excluded_platforms: FrozenSet[str]
     min_memory_gb: int
     min_cpu_cores: int
     gpu_required: bool
     required_capabilities: List[str]
     environment_requirements: Dict[str, Any]
+    
+    def __post_init__(self):
+        # 平台列表转为frozenset，验证时成员判断为O(1)
+        self.required_platforms = frozenset(self.required_platforms)
+        self.preferred_platforms = frozenset(self.preferred_platforms)
+        self.excluded_platforms = frozenset(self.excluded_platforms)
 
 class PowerAutomationE2ETestBase(unittest.TestCase):
     """PowerAutomation端到端测试基类"""
@@ -35,10 +64,9 @@ class PowerAutomationE2ETestBase(unittest.TestCase):
     
     def _load_test_config(self) -> Dict[str, Any]:
         """加载测试配置"""
-        config_path = Path(__file__).parent / "configs" / "e2e_config.yaml"
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+        if _CONFIG_PATH.exists():
+            with open(_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                return yaml.load(f, Loader=_YamlLoader)
         return {}
     
     def _load_preconditions(self) -> Optional[E2EPreconditions]:
@@ -70,38 +98,31 @@ class PowerAutomationE2ETestBase(unittest.TestCase):
     
     def _get_current_platform(self) -> str:
         """获取当前平台"""
-        import platform
-        system = platform.system().lower()
-        if system == "darwin":
-            return "macos"
-        return system
+        return _CURRENT_PLATFORM
     
     def _check_system_resources(self) -> bool:
         """检查系统资源"""
         try:
-            import psutil
-            
-            # 检查内存
-            memory_gb = psutil.virtual_memory().total / (1024**3)
-            if memory_gb < self.preconditions.min_memory_gb:
-                return False
-            
-            # 检查CPU核心数
-            cpu_cores = psutil.cpu_count()
-            if cpu_cores < self.preconditions.min_cpu_cores:
-                return False
-            
-            return True
+            memory_gb, cpu_cores = _system_resources()
         except ImportError:
             # 如果psutil不可用，跳过资源检查
             return True
+        
+        # 检查内存
+        if memory_gb < self.preconditions.min_memory_gb:
+            return False
+        
+        # 检查CPU核心数
+        if cpu_cores < self.preconditions.min_cpu_cores:
+            return False
+        
+        return True
     
     def take_screenshot(self, name: str) -> str:
         """截图功能"""
-        screenshot_dir = Path(__file__).parent / "screenshots"
-        screenshot_dir.mkdir(exist_ok=True)
+        _SCREENSHOT_DIR.mkdir(exist_ok=True)
         
-        screenshot_path = screenshot_dir / f"{name}_{self._get_timestamp()}.png"
+        screenshot_path = _SCREENSHOT_DIR / f"{name}_{self._get_timestamp()}.png"
         
         try:
             # 这里可以集成不同的截图工具
@@ -14,6 +14,28 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+try:
+    import xdist
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
+
+def _dump_json_report(data: Dict[str, Any], path: Path):
+    """写入JSON报告（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 class E2ETestRunner:
     """端到端测试运行器"""
     
@@ -84,11 +106,17 @@ class E2ETestRunner:
             str(test_dir),
             "-v",
             "--tb=short",
-            "--capture=no",
-            f"--html={report_file}",
-            "--self-contained-html"
+            f"--html={report_file}"
         ]
         
+        # 仅在CI环境中生成自包含HTML报告
+        if os.environ.get("CI"):
+            pytest_args.append("--self-contained-html")
+        
+        # 安装pytest-xdist时并行执行（视觉测试通过xdist_group固定在同一worker）
+        if XDIST_AVAILABLE:
+            pytest_args.extend(["-n", "auto", "--dist=loadgroup"])
+        
         try:
             start_time = datetime.now()
             result = pytest.main(pytest_args)
@@ -147,9 +175,7 @@ class E2ETestRunner:
         
         # 保存JSON报告
         json_report_path = self.report_dir / f"e2e_comprehensive_report_{timestamp}.json"
-        import json
-        with open(json_report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        _dump_json_report(report_data, json_report_path)
         
         print(f"\n📊 综合报告已生成: {json_report_path}")
 
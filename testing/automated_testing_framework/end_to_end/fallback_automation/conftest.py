@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+PowerAutomation 兜底自动化测试参数化
+
+从 fallback_configs.json 读取兜底测试配置，
+为请求 cfg 参数的测试生成参数化用例
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+CONFIG_INDEX_PATH = Path(__file__).parent / "fallback_configs.json"
+
+_fallback_configs: List[Dict[str, Any]] = []
+
+def _load_fallback_configs() -> List[Dict[str, Any]]:
+    """加载兜底测试配置索引（每个会话只读取一次）"""
+    if not _fallback_configs:
+        with open(CONFIG_INDEX_PATH, 'r', encoding='utf-8') as f:
+            _fallback_configs.extend(json.load(f))
+    return _fallback_configs
+
+def pytest_generate_tests(metafunc):
+    """按配置索引参数化兜底测试"""
+    if "cfg" in metafunc.fixturenames:
+        configs = _load_fallback_configs()
+        metafunc.parametrize("cfg", configs, ids=[config["test_id"] for config in configs])
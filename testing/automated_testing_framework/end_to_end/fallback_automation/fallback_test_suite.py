@@ -5,19 +5,22 @@ PowerAutomation 兜底自动化测试套件
 集成所有兜底自动化测试用例的执行套件
 """
 
+import os
 import pytest
-import sys
 from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
+try:
+    import xdist
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
 
 class FallbackTestSuite:
     """兜底自动化测试套件"""
     
     def __init__(self):
         self.test_dir = Path(__file__).parent
-        self.test_files = list(self.test_dir.glob("test_*_op_*.py"))
+        self.test_file = self.test_dir / "test_fallback.py"
     
     def run_all_tests(self):
         """运行所有兜底测试"""
@@ -28,11 +31,17 @@ class FallbackTestSuite:
             str(self.test_dir),
             "-v",
             "--tb=short",
-            "--capture=no",
-            f"--html={self.test_dir}/fallback_test_report.html",
-            "--self-contained-html"
+            f"--html={self.test_dir}/fallback_test_report.html"
         ]
         
+        # 仅在CI环境中生成自包含HTML报告
+        if os.environ.get("CI"):
+            pytest_args.append("--self-contained-html")
+        
+        # 安装pytest-xdist时并行执行（视觉测试通过xdist_group固定在同一worker）
+        if XDIST_AVAILABLE:
+            pytest_args.extend(["-n", "auto", "--dist=loadgroup"])
+        
         # 执行测试
         result = pytest.main(pytest_args)
         
@@ -45,13 +54,12 @@ class FallbackTestSuite:
     
     def run_specific_test(self, test_id: str):
         """运行特定的兜底测试"""
-        test_file = self.test_dir / f"test_{test_id.lower()}.py"
-        
-        if not test_file.exists():
-            print(f"❌ 测试文件不存在: {test_file}")
+        if not self.test_file.exists():
+            print(f"❌ 测试文件不存在: {self.test_file}")
             return False
         
-        pytest_args = [str(test_file), "-v"]
+        # 参数化用例ID即测试ID
+        pytest_args = [str(self.test_file), "-v", "-k", test_id]
         result = pytest.main(pytest_args)
         
         return result == 0
@@ -1,54 +1,25 @@
 #!/usr/bin/env python3
 """
-数据流控制兜底操作测试
-测试ID: DFC_OP_001
-业务模块: DataFlowControl
+PowerAutomation 兜底自动化操作测试
 
-验证数据流控制系统的兜底机制，确保在数据流异常时能够正确处理和恢复
+所有兜底测试用例共享同一组测试方法，
+由 conftest.py 根据 fallback_configs.json 参数化展开
 """
 
-import pytest
-import sys
 import os
-from pathlib import Path
+import pytest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
-
-class TestDFCOP001:
-    """
-    数据流控制兜底操作测试
-    
-    前置条件:
-    - 平台要求: ['linux']
-    - 资源要求: {'min_memory_gb': 32, 'min_cpu_cores': 16, 'gpu_required': False}
-    - 能力要求: ['data_test', 'flow_control_test', 'fallback_test']
-    """
+class TestFallbackOperation:
+    """兜底自动化操作测试"""
     
-    @classmethod
-    def setup_class(cls):
-        """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "DFC_OP_001",
-            "test_name": "数据流控制兜底操作测试",
-            "preconditions": {
-                "platform": {'required_platforms': ['linux'], 'preferred_platforms': ['linux'], 'excluded_platforms': ['windows', 'macos']},
-                "resources": {'min_memory_gb': 32, 'min_cpu_cores': 16, 'gpu_required': False},
-                "capabilities": ['data_test', 'flow_control_test', 'fallback_test'],
-                "environment": {'database': 'PostgreSQL 14+', 'cache': 'Redis 7.0+'},
-                "dependencies": ['data_engine', 'flow_controller', 'backup_system']
-            }
-        }
-    
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        # 验证前置条件
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
-        )
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, cfg, validator):
+        """每个测试方法前验证当前用例的前置条件"""
+        self.validator = validator
+        self.test_config = cfg
+        validation_result = self.validator.validate_preconditions_cached(cfg["preconditions"])
         
         if not validation_result["valid"]:
             pytest.skip(f"前置条件不满足: {validation_result['reason']}")
@@ -81,13 +52,13 @@ class TestDFCOP001:
         """测试兜底机制性能"""
         import time
         
-        start_time = time.time()
+        # 使用单调的纳秒计时器，避免系统时钟调整影响耗时判断
+        start_time = time.perf_counter_ns()
         
         # 执行兜底流程
         fallback_result = self._trigger_fallback_mechanism()
         
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # 验证性能要求（兜底机制应在5秒内完成）
         assert execution_time < 5.0, f"兜底机制执行时间过长: {execution_time:.2f}秒"
@@ -95,21 +66,24 @@ class TestDFCOP001:
     
     def test_fallback_stress_testing(self):
         """测试兜底机制压力测试"""
-        success_count = 0
         total_tests = 10
         
-        for i in range(total_tests):
-            try:
-                result = self._trigger_fallback_mechanism()
-                if result["success"]:
-                    success_count += 1
-            except Exception as e:
-                print(f"压力测试第{i+1}次失败: {e}")
+        # 各次触发相互独立，并发执行
+        with ThreadPoolExecutor(max_workers=min(total_tests, os.cpu_count() or 1)) as executor:
+            success_count = sum(executor.map(self._run_stress_iteration, range(total_tests)))
         
         # 验证成功率（应达到90%以上）
         success_rate = success_count / total_tests
         assert success_rate >= 0.9, f"兜底机制成功率过低: {success_rate:.1%}"
     
+    def _run_stress_iteration(self, index: int) -> bool:
+        """执行单次压力测试，返回兜底机制是否成功"""
+        try:
+            return self._trigger_fallback_mechanism()["success"]
+        except Exception as e:
+            print(f"压力测试第{index+1}次失败: {e}")
+            return False
+    
     def _trigger_fallback_mechanism(self) -> Dict[str, Any]:
         """触发兜底机制"""
         # 这里应该实现具体的兜底机制触发逻辑
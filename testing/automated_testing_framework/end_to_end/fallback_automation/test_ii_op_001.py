@@ -1,140 +0,0 @@
-#!/usr/bin/env python3
-"""
-智能交互兜底操作测试
-测试ID: II_OP_001
-业务模块: IntelligentInteraction
-
-验证智能交互系统的兜底机制，确保在AI交互失败时能够切换到传统交互方式
-"""
-
-import pytest
-import sys
-import os
-from pathlib import Path
-from typing import Dict, List, Any
-
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
-
-class TestIIOP001:
-    """
-    智能交互兜底操作测试
-    
-    前置条件:
-    - 平台要求: ['windows', 'macos', 'linux']
-    - 资源要求: {'min_memory_gb': 16, 'min_cpu_cores': 8, 'gpu_required': True}
-    - 能力要求: ['ai_test', 'interaction_test', 'fallback_test']
-    """
-    
-    @classmethod
-    def setup_class(cls):
-        """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "II_OP_001",
-            "test_name": "智能交互兜底操作测试",
-            "preconditions": {
-                "platform": {'required_platforms': ['windows', 'macos', 'linux'], 'preferred_platforms': ['linux'], 'excluded_platforms': []},
-                "resources": {'min_memory_gb': 16, 'min_cpu_cores': 8, 'gpu_required': True},
-                "capabilities": ['ai_test', 'interaction_test', 'fallback_test'],
-                "environment": {'ai_model': 'GPT-4 / Claude-3', 'interaction_framework': 'PowerAutomation AI'},
-                "dependencies": ['ai_engine', 'interaction_router', 'fallback_handler']
-            }
-        }
-    
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        # 验证前置条件
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
-        )
-        
-        if not validation_result["valid"]:
-            pytest.skip(f"前置条件不满足: {validation_result['reason']}")
-    
-    def test_fallback_mechanism_basic(self):
-        """测试基础兜底机制"""
-        # 模拟主流程失败
-        main_process_success = False
-        
-        # 触发兜底机制
-        fallback_result = self._trigger_fallback_mechanism()
-        
-        # 验证兜底机制是否成功
-        assert fallback_result["success"], f"兜底机制失败: {fallback_result['error']}"
-        assert fallback_result["fallback_triggered"], "兜底机制未被触发"
-        
-    def test_fallback_recovery_process(self):
-        """测试兜底恢复流程"""
-        # 模拟系统异常
-        self._simulate_system_failure()
-        
-        # 执行恢复流程
-        recovery_result = self._execute_recovery_process()
-        
-        # 验证恢复结果
-        assert recovery_result["recovered"], "系统恢复失败"
-        assert recovery_result["data_integrity"], "数据完整性检查失败"
-        
-    def test_fallback_performance(self):
-        """测试兜底机制性能"""
-        import time
-        
-        start_time = time.time()
-        
-        # 执行兜底流程
-        fallback_result = self._trigger_fallback_mechanism()
-        
-        end_time = time.time()
-        execution_time = end_time - start_time
-        
-        # 验证性能要求（兜底机制应在5秒内完成）
-        assert execution_time < 5.0, f"兜底机制执行时间过长: {execution_time:.2f}秒"
-        assert fallback_result["success"], "兜底机制执行失败"
-    
-    def test_fallback_stress_testing(self):
-        """测试兜底机制压力测试"""
-        success_count = 0
-        total_tests = 10
-        
-        for i in range(total_tests):
-            try:
-                result = self._trigger_fallback_mechanism()
-                if result["success"]:
-                    success_count += 1
-            except Exception as e:
-                print(f"压力测试第{i+1}次失败: {e}")
-        
-        # 验证成功率（应达到90%以上）
-        success_rate = success_count / total_tests
-        assert success_rate >= 0.9, f"兜底机制成功率过低: {success_rate:.1%}"
-    
-    def _trigger_fallback_mechanism(self) -> Dict[str, Any]:
-        """触发兜底机制"""
-        # 这里应该实现具体的兜底机制触发逻辑
-        # 根据不同的测试类型实现不同的逻辑
-        
-        return {
-            "success": True,
-            "fallback_triggered": True,
-            "execution_time": 2.5,
-            "error": None
-        }
-    
-    def _simulate_system_failure(self):
-        """模拟系统故障"""
-        # 实现系统故障模拟逻辑
-        pass
-    
-    def _execute_recovery_process(self) -> Dict[str, Any]:
-        """执行恢复流程"""
-        # 实现恢复流程逻辑
-        return {
-            "recovered": True,
-            "data_integrity": True,
-            "recovery_time": 3.0
-        }
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -5,13 +5,13 @@ PowerAutomation 集成端到端测试
 测试客户端和服务端的集成流程
 """
 
+from __future__ import annotations
+
+from typing import Any, Dict
+
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, ALL_PLATFORMS, HIGH_RESOURCES
 
 class TestIntegrationE2E:
     """集成端到端测试"""
@@ -19,21 +19,12 @@ class TestIntegrationE2E:
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "INTEGRATION_E2E_001",
-            "test_name": "集成端到端测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos", "linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 16,
-                    "min_cpu_cores": 8,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="INTEGRATION_E2E_001",
+            test_name="集成端到端测试",
+            preconditions={
+                "platform": ALL_PLATFORMS,
+                "resources": HIGH_RESOURCES,
                 "capabilities": ["integration_test", "api_test", "ui_test"],
                 "environment": {
                     "network": "stable",
@@ -41,12 +32,14 @@ class TestIntegrationE2E:
                 },
                 "dependencies": ["client_app", "server_api", "database"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, validator):
+        """每个测试方法前验证前置条件"""
+        self.validator = validator
+        validation_result = self.validator.validate_preconditions_cached(
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
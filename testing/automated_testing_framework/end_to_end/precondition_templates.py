@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+PowerAutomation 端到端测试前置条件模板
+
+各端到端测试类共用的测试配置结构与平台、资源要求，
+平台与资源要求以只读映射形式在模块级别只创建一次
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict
+
+@dataclass(frozen=True, slots=True)
+class E2ETestConfig:
+    """端到端测试类配置"""
+    test_id: str
+    test_name: str
+    preconditions: Dict[str, Any]
+
+# 平台要求
+ALL_PLATFORMS = MappingProxyType({
+    "required_platforms": ["windows", "macos", "linux"],
+    "preferred_platforms": ["linux"],
+    "excluded_platforms": []
+})
+
+DESKTOP_PLATFORMS = MappingProxyType({
+    "required_platforms": ["windows", "macos"],
+    "preferred_platforms": ["windows"],
+    "excluded_platforms": []
+})
+
+LINUX_PLATFORMS = MappingProxyType({
+    "required_platforms": ["linux"],
+    "preferred_platforms": ["linux"],
+    "excluded_platforms": []
+})
+
+# 资源要求
+BASIC_RESOURCES = MappingProxyType({
+    "min_memory_gb": 4,
+    "min_cpu_cores": 2,
+    "gpu_required": False
+})
+
+STANDARD_RESOURCES = MappingProxyType({
+    "min_memory_gb": 8,
+    "min_cpu_cores": 4,
+    "gpu_required": False
+})
+
+HIGH_RESOURCES = MappingProxyType({
+    "min_memory_gb": 16,
+    "min_cpu_cores": 8,
+    "gpu_required": False
+})
@@ -5,13 +5,13 @@ PowerAutomation 服务端端到端测试
 测试服务端功能的端到端流程
 """
 
+from __future__ import annotations
+
+from typing import Any, Dict
+
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from test_preconditions import PreconditionValidator
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, LINUX_PLATFORMS, HIGH_RESOURCES
 
 class TestServerSideE2E:
     """服务端端到端测试"""
@@ -19,21 +19,12 @@ class TestServerSideE2E:
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = PreconditionValidator()
-        cls.test_config = {
-            "test_id": "SERVER_E2E_001",
-            "test_name": "服务端端到端测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 16,
-                    "min_cpu_cores": 8,
-                    "gpu_required": False
-                },
+        cls.test_config = E2ETestConfig(
+            test_id="SERVER_E2E_001",
+            test_name="服务端端到端测试",
+            preconditions={
+                "platform": LINUX_PLATFORMS,
+                "resources": HIGH_RESOURCES,
                 "capabilities": ["api_test", "data_test", "performance_test"],
                 "environment": {
                     "database": "PostgreSQL 14+",
@@ -42,12 +33,14 @@ class TestServerSideE2E:
                 },
                 "dependencies": ["database_engine", "cache_system", "api_gateway"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
-        validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, validator):
+        """每个测试方法前验证前置条件"""
+        self.validator = validator
+        validation_result = self.validator.validate_preconditions_cached(
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
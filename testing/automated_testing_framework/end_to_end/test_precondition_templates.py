@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+PowerAutomation 前置条件模板测试
+
+验证模板中的只读平台、资源要求可直接用于缓存验证
+"""
+
+from testing.automated_testing_framework.end_to_end.precondition_templates import ALL_PLATFORMS, BASIC_RESOURCES, HIGH_RESOURCES
+
+class TestPreconditionTemplates:
+    """前置条件模板测试"""
+    
+    def test_cached_validation_accepts_template_constants(self, enhanced_validator):
+        """模板常量构成的前置条件与等价的普通字典得到相同的验证结果"""
+        preconditions = {
+            "platform": ALL_PLATFORMS,
+            "resources": BASIC_RESOURCES,
+            "capabilities": ["basic_test"]
+        }
+        
+        result = enhanced_validator.validate_preconditions_cached(preconditions)
+        
+        expected = enhanced_validator.validate_preconditions({
+            "platform": dict(ALL_PLATFORMS),
+            "resources": dict(BASIC_RESOURCES),
+            "capabilities": ["basic_test"]
+        })
+        assert result["valid"] == expected["valid"]
+        assert result["reason"] == expected["reason"]
+    
+    def test_cached_validation_distinguishes_template_constants(self, enhanced_validator):
+        """不同的模板常量不会共用缓存的验证结果"""
+        for resources in (BASIC_RESOURCES, HIGH_RESOURCES):
+            result = enhanced_validator.validate_preconditions_cached({"platform": ALL_PLATFORMS, "resources": resources})
+            expected = enhanced_validator.validate_preconditions({"platform": dict(ALL_PLATFORMS), "resources": dict(resources)})
+            assert result["valid"] == expected["valid"]
+            assert result["reason"] == expected["reason"]
@@ -9,15 +9,48 @@ PowerAutomation 增强前置条件系统
 import os
 import sys
 import json
-import yaml
+import shutil
 import platform
-import psutil
-import subprocess
+import atexit
+import threading
+import importlib.util
+from enum import IntEnum
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, NamedTuple, Optional
 from dataclasses import dataclass, asdict
 
-@dataclass
+try:
+    import pynvml
+    PYNVML_AVAILABLE = True
+except ImportError:
+    PYNVML_AVAILABLE = False
+
+@cache
+def _init_nvml() -> Optional[tuple]:
+    """初始化NVML并返回GPU设备句柄（每个进程只初始化一次）
+    
+    返回None表示NVML不可用（未安装pynvml或找不到驱动库），需要回退到nvidia-smi
+    """
+    if not PYNVML_AVAILABLE:
+        return None
+    
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError_LibraryNotFound:
+        return None
+    except pynvml.NVMLError:
+        return ()
+    atexit.register(pynvml.nvmlShutdown)
+    
+    try:
+        return tuple(pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount()))
+    except pynvml.NVMLError:
+        return ()
+
+@dataclass(slots=True, frozen=True)
 class TestPreconditions:
     """测试前置条件数据类"""
     platform: Dict[str, List[str]]
@@ -26,20 +59,494 @@ class TestPreconditions:
     environment: Dict[str, str]
     dependencies: List[str]
 
+class PlatformInfo(NamedTuple):
+    """平台信息"""
+    system: str
+    release: str
+    machine: str
+    python_version: str
+    node: str
+
+# 1GB对应的字节数
+_GIB = 1 << 30
+
+def _format_resources(system_resources: Dict[str, Any]) -> Dict[str, Any]:
+    """资源信息展示视图（浮点数值保留两位小数，内部比较使用原始值）"""
+    return {key: round(value, 2) if isinstance(value, float) else value for key, value in system_resources.items()}
+
+# 以下系统探测结果在测试运行期间不会变化，每个进程只采集一次，
+# 各验证器实例共享同一份结果（请勿修改返回的对象）
+
+@cache
+def _platform_info() -> PlatformInfo:
+    """获取平台信息"""
+    return PlatformInfo(
+        system=platform.system(),
+        release=platform.release(),
+        machine=platform.machine(),
+        python_version=platform.python_version(),
+        node=platform.node()
+    )
+
+class _Platform(IntEnum):
+    """平台编号（可直接用作按平台分派的元组下标）"""
+    LINUX = 0
+    MACOS = 1
+    WINDOWS = 2
+    UNKNOWN = 3
+
+# 平台编号对应的平台名称（即 current_platform 的取值）
+_PLATFORM_NAMES = ("linux", "macos", "windows", "unknown")
+
+# 当前平台（进程内不会变化，模块导入时检测一次）
+_PLATFORM = {
+    "linux": _Platform.LINUX,
+    "darwin": _Platform.MACOS,
+    "windows": _Platform.WINDOWS
+}.get(platform.system().lower(), _Platform.UNKNOWN)
+_CURRENT_PLATFORM = _PLATFORM_NAMES[_PLATFORM]
+
+@cache
+def _get_host_resources() -> Dict[str, Any]:
+    """获取内存、CPU与磁盘资源信息"""
+    memory_gb = _total_memory_bytes() / _GIB
+    cpu_cores = os.cpu_count()
+    disk_free, disk_total = _root_disk_space()
+    
+    return {
+        "memory_gb": memory_gb,
+        "cpu_cores": cpu_cores,
+        "disk_free_gb": disk_free / _GIB,
+        "disk_total_gb": disk_total / _GIB
+    }
+
+def _get_system_resources() -> Dict[str, Any]:
+    """获取系统资源信息
+    
+    GPU信息每次都从后台探测结果读取而不随主机资源缓存，探测超时时本次按无GPU处理，
+    探测完成后的访问即可得到真实结果
+    """
+    gpu_info = _wait_gpu_info()
+    return {
+        **_get_host_resources(),
+        "gpu_available": gpu_info["available"],
+        "gpu_info": gpu_info
+    }
+
+# 未检测到GPU时的GPU信息
+_NO_GPU_INFO = {
+    "available": False,
+    "type": "none",
+    "memory_gb": 0,
+    "driver_version": ""
+}
+
+# nvidia-smi的超时秒数（健康驱动远低于该值，驱动挂起时视为无GPU）
+_NVIDIA_SMI_TIMEOUT = 1.0
+
+# 等待后台GPU探测完成的最长秒数
+_GPU_PROBE_WAIT = 1.0
+
+@cache
+def _start_gpu_probe() -> Future:
+    """在独立的守护线程中启动GPU探测（每个进程只启动一次）
+    
+    探测不占用验证线程池，驱动挂起时也不会阻塞解释器退出
+    """
+    future = Future()
+    threading.Thread(target=_run_gpu_probe, args=(future,), name="gpu-probe", daemon=True).start()
+    return future
+
+def _run_gpu_probe(future: Future):
+    """执行GPU探测并将结果写入future"""
+    try:
+        future.set_result(_get_gpu_info())
+    except Exception as e:
+        future.set_exception(e)
+
+def _gpu_probe_done() -> bool:
+    """后台GPU探测是否已完成"""
+    return _start_gpu_probe().done()
+
+def _wait_gpu_info() -> Dict[str, Any]:
+    """等待后台GPU探测结果，未能及时完成时本次按无GPU处理（不缓存超时结果）"""
+    try:
+        return _start_gpu_probe().result(timeout=_GPU_PROBE_WAIT)
+    except FutureTimeoutError:
+        return dict(_NO_GPU_INFO)
+
+@cache
+def _cpu_frequency_mhz() -> float:
+    """CPU当前频率（Linux上需逐核读取sysfs，仅在需要时采集）"""
+    import psutil
+    
+    cpu_freq = psutil.cpu_freq()
+    return cpu_freq.current if cpu_freq else 0
+
+def _root_disk_space() -> tuple:
+    """根分区的 (可用字节数, 总字节数)"""
+    disk_usage = shutil.disk_usage('/')
+    return disk_usage.free, disk_usage.total
+
+# 支持sysconf物理页数查询的平台可不经psutil获取物理内存
+_SYSCONF_MEMORY = hasattr(os, "sysconf") and "SC_PHYS_PAGES" in os.sysconf_names
+
+def _total_memory_bytes() -> int:
+    """物理内存总字节数"""
+    if _SYSCONF_MEMORY:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    import psutil
+    
+    return psutil.virtual_memory().total
+
+@cache
+def _get_gpu_info() -> Dict[str, Any]:
+    """获取GPU信息"""
+    gpu_info = dict(_NO_GPU_INFO)
+    
+    nvml_handles = _init_nvml()
+    if nvml_handles is not None:
+        # 通过NVML直接查询NVIDIA GPU，无需启动nvidia-smi子进程
+        if nvml_handles:
+            gpu_info.update(_query_nvml_gpu(nvml_handles[0]))
+    else:
+        gpu_info.update(_query_nvidia_smi_gpu())
+    
+    # 可以添加其他GPU检测逻辑（AMD、Intel等）
+    if not gpu_info["available"]:
+        # 检查是否有集成显卡
+        if _PLATFORM is _Platform.MACOS:
+            gpu_info.update({
+                "available": True,
+                "type": "integrated",
+                "name": "Apple Integrated GPU"
+            })
+    
+    return gpu_info
+
+def _query_nvml_gpu(handle) -> Dict[str, Any]:
+    """通过NVML查询NVIDIA GPU信息"""
+    try:
+        name = pynvml.nvmlDeviceGetName(handle)
+        memory_total = pynvml.nvmlDeviceGetMemoryInfo(handle).total
+        driver_version = pynvml.nvmlSystemGetDriverVersion()
+    except pynvml.NVMLError:
+        return {}
+    
+    # 旧版pynvml返回bytes
+    if isinstance(name, bytes):
+        name = name.decode()
+    if isinstance(driver_version, bytes):
+        driver_version = driver_version.decode()
+    
+    return {
+        "available": True,
+        "type": "nvidia",
+        "name": name,
+        "memory_gb": round(memory_total / _GIB, 2),
+        "driver_version": driver_version
+    }
+
+# nvidia-smi回退查询：一次调用取回所需的全部字段，且只查询上报的第一块GPU
+_NVIDIA_SMI_QUERY = (
+    "nvidia-smi",
+    "--id=0",
+    "--query-gpu=name,memory.total,driver_version",
+    "--format=csv,noheader,nounits"
+)
+
+def _query_nvidia_smi_gpu() -> Dict[str, Any]:
+    """通过nvidia-smi查询NVIDIA GPU信息（NVML不可用时的回退路径）"""
+    import subprocess
+    
+    try:
+        # 尝试检测NVIDIA GPU
+        result = subprocess.run(_NVIDIA_SMI_QUERY, capture_output=True, text=True, timeout=_NVIDIA_SMI_TIMEOUT)
+        if result.returncode == 0:
+            first_line = result.stdout.strip().partition('\n')[0]
+            if first_line:
+                parts = first_line.split(', ')
+                if len(parts) >= 3:
+                    return {
+                        "available": True,
+                        "type": "nvidia",
+                        "name": parts[0],
+                        "memory_gb": round(float(parts[1]) / 1024, 2),
+                        "driver_version": parts[2]
+                    }
+    except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
+        pass
+    
+    return {}
+
+@cache
+def _get_environment_info() -> Dict[str, str]:
+    """获取环境信息"""
+    info = _platform_info()
+    env_info = {
+        "os_name": info.system,
+        "os_version": info.release,
+        "python_version": info.python_version,
+        "architecture": info.machine,
+        "hostname": info.node
+    }
+    
+    # 添加特定平台的信息
+    env_info.update(_PLATFORM_ENV_PROBES[_PLATFORM]())
+    
+    return env_info
+
+def _linux_env_info() -> Dict[str, str]:
+    """Linux发行版信息"""
+    try:
+        text = Path('/etc/os-release').read_text()
+    except FileNotFoundError:
+        return {}
+    
+    # 前置换行保证只匹配行首的PRETTY_NAME
+    _, found, rest = ("\n" + text).partition("\nPRETTY_NAME=")
+    if not found:
+        return {}
+    return {"linux_distribution": rest.split("\n", 1)[0].strip().strip('"')}
+
+def _macos_env_info() -> Dict[str, str]:
+    """macOS版本信息"""
+    return {"macos_version": platform.mac_ver()[0]}
+
+def _windows_env_info() -> Dict[str, str]:
+    """Windows版本信息"""
+    return {"windows_version": platform.win32_ver()[0]}
+
+# 按平台编号分派的特定平台信息采集函数
+_PLATFORM_ENV_PROBES = (_linux_env_info, _macos_env_info, _windows_env_info, dict)
+
+# 能力全集，每种能力对应位掩码中的一位（顺序即检测顺序）
+_CAPABILITY_NAMES = (
+    "basic_test",
+    "ui_test",
+    "ai_test",
+    "automation_test",
+    "fallback_test",
+    "data_test",
+    "version_test",
+    "performance_test",
+    "api_test",
+    "integration_test",
+    "ios_test",
+    "security_test"
+)
+_CAPABILITY_BITS = {name: 1 << index for index, name in enumerate(_CAPABILITY_NAMES)}
+
+@lru_cache(maxsize=None)
+def _decode_capabilities(mask: int) -> tuple:
+    """将能力位掩码解码为能力名称（按能力全集顺序）"""
+    return tuple(name for name in _CAPABILITY_NAMES if mask & _CAPABILITY_BITS[name])
+
+@lru_cache(maxsize=None)
+def _capability_set(mask: int) -> FrozenSet[str]:
+    """能力位掩码对应的能力集合"""
+    return frozenset(_decode_capabilities(mask))
+
+@lru_cache(maxsize=256)
+def _capability_requirement_mask(capabilities: tuple) -> tuple:
+    """将需求能力列表编码为 (位掩码, 能力全集之外的能力)"""
+    mask = 0
+    unknown = []
+    for capability in capabilities:
+        bit = _CAPABILITY_BITS.get(capability)
+        if bit is None:
+            unknown.append(capability)
+        else:
+            mask |= bit
+    return mask, tuple(unknown)
+
+@cache
+def _detect_capabilities() -> int:
+    """检测可用能力，返回能力位掩码"""
+    caps = _CAPABILITY_BITS
+    
+    # 基础、自动化、兜底、版本、API与集成测试能力始终可用
+    mask = (caps["basic_test"] | caps["automation_test"] | caps["fallback_test"] |
+            caps["version_test"] | caps["api_test"] | caps["integration_test"])
+    
+    # UI测试能力
+    if _check_ui_test_capability():
+        mask |= caps["ui_test"]
+    
+    # 资源相关能力（资源信息只读取一次）
+    system_resources = _get_host_resources()
+    memory_gb = system_resources["memory_gb"]
+    cpu_cores = system_resources["cpu_cores"]
+    disk_free_gb = system_resources["disk_free_gb"]
+    
+    # AI测试与性能测试能力
+    if memory_gb >= 8 and cpu_cores >= 4:
+        mask |= caps["ai_test"] | caps["performance_test"]
+    
+    # 数据测试能力
+    if memory_gb >= 4 and disk_free_gb >= 10:
+        mask |= caps["data_test"]
+    
+    # iOS测试能力（仅macOS）
+    if _PLATFORM is _Platform.MACOS:
+        mask |= caps["ios_test"]
+    
+    # 安全测试能力
+    if _check_security_test_capability():
+        mask |= caps["security_test"]
+    
+    return mask
+
+def _check_ui_test_capability() -> bool:
+    """检查UI测试能力"""
+    return _UI_TEST_CHECKS[_PLATFORM]()
+
+def _has_display() -> bool:
+    """Linux下是否有图形界面"""
+    return os.environ.get("DISPLAY") is not None
+
+def _always_available() -> bool:
+    """Windows和macOS通常有图形界面"""
+    return True
+
+@lru_cache(maxsize=256)
+def _dependency_installed(dependency: str) -> bool:
+    """依赖是否为PATH中的可执行文件或可导入的Python模块（每个依赖只查找一次）"""
+    if shutil.which(dependency) is not None:
+        return True
+    try:
+        return importlib.util.find_spec(dependency) is not None
+    except (ImportError, ValueError):
+        return False
+
+# 按平台编号分派的UI测试能力检查
+_UI_TEST_CHECKS = (_has_display, _always_available, _always_available, _always_available)
+
+def _check_security_test_capability() -> bool:
+    """检查安全测试能力"""
+    # 检查是否有必要的安全测试工具
+    return True  # 基础安全测试能力
+
+@cache
+def _load_framework_config() -> Dict[str, Any]:
+    """加载测试框架配置"""
+    config_paths = [
+        Path(__file__).parent / "test_framework_config.yaml",
+        Path(__file__).parent / "end_to_end" / "configs" / "e2e_config.yaml"
+    ]
+    
+    config = {}
+    for config_path in config_paths:
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        
+        try:
+            file_config = _load_yaml_file(config_path, mtime_ns)
+            if file_config:
+                config.update(file_config)
+        except Exception as e:
+            print(f"警告: 无法加载配置文件 {config_path}: {e}")
+    
+    return config
+
+@lru_cache(maxsize=16)
+def _load_yaml_file(config_path: Path, mtime_ns: int) -> Any:
+    """解析YAML配置文件（按路径与修改时间缓存，文件未变化时不重复解析）"""
+    import yaml
+    
+    # 优先使用libyaml的C实现
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(config_path.read_bytes(), Loader=loader)
+
+# refresh() 需要清除的探测缓存
+_SYSTEM_PROBES = (
+    _platform_info,
+    _get_host_resources,
+    _cpu_frequency_mhz,
+    _get_gpu_info,
+    _start_gpu_probe,
+    _get_environment_info,
+    _detect_capabilities,
+    _dependency_installed,
+    _load_framework_config
+)
+
+def _freeze_preconditions(value: Any) -> Any:
+    """将嵌套的前置条件转换为可哈希的缓存键（映射包括 MappingProxyType 等只读映射）"""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze_preconditions(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_preconditions(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_preconditions(item) for item in value)
+    return value
+
+# 前置条件验证顺序: (类别, 验证方法, 缺省值工厂, 失败说明)
+_VALIDATION_CHECKS = (
+    ("platform", "_validate_platform", dict, "平台要求不满足"),
+    ("resources", "_validate_resources", dict, "资源要求不满足"),
+    ("capabilities", "_validate_capabilities", list, "能力要求不满足"),
+    ("environment", "_validate_environment", dict, "环境要求不满足"),
+    ("dependencies", "_validate_dependencies", list, "依赖要求不满足")
+)
+
+def _record_failure(validation_result: Dict[str, Any], label: str, category_valid: Dict[str, Any]):
+    """将不满足的类别验证结果记入总验证结果"""
+    validation_result["valid"] = False
+    validation_result["reason"] = f"{label}: {category_valid['reason']}"
+    validation_result["recommendations"].extend(category_valid.get("recommendations", []))
+
 class EnhancedPreconditionValidator:
     """增强前置条件验证器"""
     
+    # 所有验证器实例共享的并行验证线程池（线程在首次提交任务时才创建）
+    _executor = ThreadPoolExecutor(max_workers=len(_VALIDATION_CHECKS), thread_name_prefix="precondition-check")
+    
     def __init__(self):
-        self.current_platform = self._detect_platform()
-        self.system_resources = self._get_system_resources()
-        self.available_capabilities = self._detect_capabilities()
-        self.environment_info = self._get_environment_info()
+        # 系统探测结果按进程缓存，重复构造验证器不会重新采集
+        self.current_platform = _CURRENT_PLATFORM
+        
+        # 先在后台启动GPU探测，与环境信息采集和配置加载重叠执行
+        self._gpu_future = _start_gpu_probe()
+        self.environment_info = _get_environment_info()
         
         # 加载测试框架配置
-        self.framework_config = self._load_framework_config()
+        self.framework_config = _load_framework_config()
+        
+        self._cap_mask = _detect_capabilities()
+        
+        # 按前置条件内容缓存的验证结果
+        self._validation_cache: Dict[tuple, Dict[str, Any]] = {}
+    
+    @property
+    def system_resources(self) -> Dict[str, Any]:
+        """系统资源信息（GPU探测未完成时每次访问重新读取探测结果）"""
+        return _get_system_resources()
     
-    def validate_preconditions(self, preconditions: Dict[str, Any]) -> Dict[str, Any]:
-        """验证前置条件"""
+    @property
+    def available_capabilities(self) -> FrozenSet[str]:
+        """可用能力集合"""
+        return _capability_set(self._cap_mask)
+    
+    @property
+    def cpu_frequency_mhz(self) -> float:
+        """CPU当前频率（首次访问时采集）"""
+        return _cpu_frequency_mhz()
+    
+    @classmethod
+    def refresh(cls):
+        """清除缓存的系统探测结果，之后构造的验证器将重新采集"""
+        for probe in _SYSTEM_PROBES:
+            probe.cache_clear()
+    
+    def validate_preconditions(self, preconditions: Dict[str, Any], parallel: bool = False) -> Dict[str, Any]:
+        """验证前置条件
+        
+        details中记录已验证类别的验证详情（包括第一个不满足的类别）；
+        parallel为True时五类验证在共享线程池中并行执行
+        """
         validation_result = {
             "valid": True,
             "reason": "",
@@ -48,53 +555,10 @@ class EnhancedPreconditionValidator:
         }
         
         try:
-            # 验证平台要求
-            platform_valid = self._validate_platform(preconditions.get("platform", {}))
-            if not platform_valid["valid"]:
-                validation_result["valid"] = False
-                validation_result["reason"] = f"平台要求不满足: {platform_valid['reason']}"
-                validation_result["recommendations"].extend(platform_valid.get("recommendations", []))
-                return validation_result
-            
-            # 验证资源要求
-            resource_valid = self._validate_resources(preconditions.get("resources", {}))
-            if not resource_valid["valid"]:
-                validation_result["valid"] = False
-                validation_result["reason"] = f"资源要求不满足: {resource_valid['reason']}"
-                validation_result["recommendations"].extend(resource_valid.get("recommendations", []))
-                return validation_result
-            
-            # 验证能力要求
-            capability_valid = self._validate_capabilities(preconditions.get("capabilities", []))
-            if not capability_valid["valid"]:
-                validation_result["valid"] = False
-                validation_result["reason"] = f"能力要求不满足: {capability_valid['reason']}"
-                validation_result["recommendations"].extend(capability_valid.get("recommendations", []))
-                return validation_result
-            
-            # 验证环境要求
-            environment_valid = self._validate_environment(preconditions.get("environment", {}))
-            if not environment_valid["valid"]:
-                validation_result["valid"] = False
-                validation_result["reason"] = f"环境要求不满足: {environment_valid['reason']}"
-                validation_result["recommendations"].extend(environment_valid.get("recommendations", []))
-                return validation_result
-            
-            # 验证依赖要求
-            dependency_valid = self._validate_dependencies(preconditions.get("dependencies", []))
-            if not dependency_valid["valid"]:
-                validation_result["valid"] = False
-                validation_result["reason"] = f"依赖要求不满足: {dependency_valid['reason']}"
-                validation_result["recommendations"].extend(dependency_valid.get("recommendations", []))
-                return validation_result
-            
-            validation_result["details"] = {
-                "platform": platform_valid,
-                "resources": resource_valid,
-                "capabilities": capability_valid,
-                "environment": environment_valid,
-                "dependencies": dependency_valid
-            }
+            if parallel:
+                self._validate_in_parallel(preconditions, validation_result)
+            else:
+                self._validate_in_order(preconditions, validation_result)
             
         except Exception as e:
             validation_result["valid"] = False
@@ -102,6 +566,45 @@ class EnhancedPreconditionValidator:
         
         return validation_result
     
+    def _validate_in_order(self, preconditions: Dict[str, Any], validation_result: Dict[str, Any]):
+        """按固定顺序逐类验证，遇到第一个不满足的类别即停止"""
+        details = validation_result["details"]
+        for category, method, default_factory, label in _VALIDATION_CHECKS:
+            category_valid = getattr(self, method)(preconditions.get(category, default_factory()))
+            details[category] = category_valid
+            if not category_valid["valid"]:
+                _record_failure(validation_result, label, category_valid)
+                return
+    
+    def _validate_in_parallel(self, preconditions: Dict[str, Any], validation_result: Dict[str, Any]):
+        """五类验证并行执行，按固定顺序汇总并报告第一个不满足的类别"""
+        futures = [
+            (category, label, self._executor.submit(getattr(self, method), preconditions.get(category, default_factory())))
+            for category, method, default_factory, label in _VALIDATION_CHECKS
+        ]
+        
+        details = validation_result["details"]
+        for index, (category, label, future) in enumerate(futures):
+            category_valid = future.result()
+            details[category] = category_valid
+            if not category_valid["valid"]:
+                for _, _, pending in futures[index + 1:]:
+                    pending.cancel()
+                _record_failure(validation_result, label, category_valid)
+                return
+    
+    def validate_preconditions_cached(self, preconditions: Dict[str, Any]) -> Dict[str, Any]:
+        """验证前置条件，内容相同的前置条件只验证一次（返回的结果为共享对象，请勿修改）"""
+        key = _freeze_preconditions(preconditions)
+        result = self._validation_cache.get(key)
+        if result is None:
+            # GPU探测尚未完成时的结果可能按无GPU得出，不予缓存
+            gpu_probe_done = _gpu_probe_done()
+            result = self.validate_preconditions(preconditions)
+            if gpu_probe_done:
+                self._validation_cache[key] = result
+        return result
+    
     def get_optimal_platform(self, platform_requirements: Dict[str, List[str]]) -> Optional[str]:
         """获取最优平台选择"""
         required_platforms = platform_requirements.get("required_platforms", [])
@@ -131,227 +634,30 @@ class EnhancedPreconditionValidator:
         
         return None
     
-    def _detect_platform(self) -> str:
-        """检测当前平台"""
-        system = platform.system().lower()
-        if system == "darwin":
-            return "macos"
-        elif system == "windows":
-            return "windows"
-        elif system == "linux":
-            return "linux"
-        else:
-            return "unknown"
-    
-    def _get_system_resources(self) -> Dict[str, Any]:
-        """获取系统资源信息"""
-        memory_gb = psutil.virtual_memory().total / (1024**3)
-        cpu_cores = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq()
-        disk_usage = psutil.disk_usage('/')
-        
-        # 检测GPU
-        gpu_info = self._get_gpu_info()
-        
-        return {
-            "memory_gb": round(memory_gb, 2),
-            "cpu_cores": cpu_cores,
-            "cpu_frequency_mhz": cpu_freq.current if cpu_freq else 0,
-            "disk_free_gb": round(disk_usage.free / (1024**3), 2),
-            "disk_total_gb": round(disk_usage.total / (1024**3), 2),
-            "gpu_available": gpu_info["available"],
-            "gpu_info": gpu_info
-        }
-    
-    def _get_gpu_info(self) -> Dict[str, Any]:
-        """获取GPU信息"""
-        gpu_info = {
-            "available": False,
-            "type": "none",
-            "memory_gb": 0,
-            "driver_version": ""
-        }
-        
-        try:
-            # 尝试检测NVIDIA GPU
-            result = subprocess.run(["nvidia-smi", "--query-gpu=name,memory.total,driver_version", "--format=csv,noheader,nounits"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if lines and lines[0]:
-                    parts = lines[0].split(', ')
-                    if len(parts) >= 3:
-                        gpu_info.update({
-                            "available": True,
-                            "type": "nvidia",
-                            "name": parts[0],
-                            "memory_gb": round(float(parts[1]) / 1024, 2),
-                            "driver_version": parts[2]
-                        })
-        except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
-            pass
-        
-        # 可以添加其他GPU检测逻辑（AMD、Intel等）
-        if not gpu_info["available"]:
-            # 检查是否有集成显卡
-            if self.current_platform == "macos":
-                gpu_info.update({
-                    "available": True,
-                    "type": "integrated",
-                    "name": "Apple Integrated GPU"
-                })
-        
-        return gpu_info
-    
-    def _get_environment_info(self) -> Dict[str, str]:
-        """获取环境信息"""
-        env_info = {
-            "os_name": platform.system(),
-            "os_version": platform.release(),
-            "python_version": platform.python_version(),
-            "architecture": platform.machine(),
-            "hostname": platform.node()
-        }
-        
-        # 添加特定平台的信息
-        if self.current_platform == "linux":
-            try:
-                with open('/etc/os-release', 'r') as f:
-                    for line in f:
-                        if line.startswith('PRETTY_NAME='):
-                            env_info["linux_distribution"] = line.split('=')[1].strip().strip('"')
-                            break
-            except FileNotFoundError:
-                pass
-        elif self.current_platform == "macos":
-            env_info["macos_version"] = platform.mac_ver()[0]
-        elif self.current_platform == "windows":
-            env_info["windows_version"] = platform.win32_ver()[0]
-        
-        return env_info
-    
-    def _detect_capabilities(self) -> List[str]:
-        """检测可用能力"""
-        capabilities = []
-        
-        # 基础能力
-        capabilities.append("basic_test")
-        
-        # UI测试能力
-        if self._check_ui_test_capability():
-            capabilities.append("ui_test")
-        
-        # AI测试能力
-        if self._check_ai_test_capability():
-            capabilities.append("ai_test")
-        
-        # 自动化测试能力
-        capabilities.append("automation_test")
-        
-        # 兜底测试能力
-        capabilities.append("fallback_test")
-        
-        # 数据测试能力
-        if self._check_data_test_capability():
-            capabilities.append("data_test")
-        
-        # 版本测试能力
-        capabilities.append("version_test")
-        
-        # 性能测试能力
-        if self._check_performance_test_capability():
-            capabilities.append("performance_test")
-        
-        # API测试能力
-        capabilities.append("api_test")
-        
-        # 集成测试能力
-        capabilities.append("integration_test")
-        
-        # iOS测试能力（仅macOS）
-        if self.current_platform == "macos":
-            capabilities.append("ios_test")
-        
-        # 安全测试能力
-        if self._check_security_test_capability():
-            capabilities.append("security_test")
-        
-        return capabilities
-    
-    def _check_ui_test_capability(self) -> bool:
-        """检查UI测试能力"""
-        if self.current_platform == "linux":
-            return os.environ.get("DISPLAY") is not None
-        else:
-            return True  # Windows和macOS通常有图形界面
-    
-    def _check_ai_test_capability(self) -> bool:
-        """检查AI测试能力"""
-        return (self.system_resources["memory_gb"] >= 8 and 
-                self.system_resources["cpu_cores"] >= 4)
-    
-    def _check_data_test_capability(self) -> bool:
-        """检查数据测试能力"""
-        return (self.system_resources["memory_gb"] >= 4 and
-                self.system_resources["disk_free_gb"] >= 10)
-    
-    def _check_performance_test_capability(self) -> bool:
-        """检查性能测试能力"""
-        return (self.system_resources["memory_gb"] >= 8 and
-                self.system_resources["cpu_cores"] >= 4)
-    
-    def _check_security_test_capability(self) -> bool:
-        """检查安全测试能力"""
-        # 检查是否有必要的安全测试工具
-        return True  # 基础安全测试能力
-    
-    def _load_framework_config(self) -> Dict[str, Any]:
-        """加载测试框架配置"""
-        config_paths = [
-            Path(__file__).parent / "test_framework_config.yaml",
-            Path(__file__).parent / "end_to_end" / "configs" / "e2e_config.yaml"
-        ]
-        
-        config = {}
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        file_config = yaml.safe_load(f)
-                        if file_config:
-                            config.update(file_config)
-                except Exception as e:
-                    print(f"警告: 无法加载配置文件 {config_path}: {e}")
-        
-        return config
-    
     def _validate_platform(self, platform_req: Dict[str, List[str]]) -> Dict[str, Any]:
         """验证平台要求"""
         required_platforms = platform_req.get("required_platforms", [])
         excluded_platforms = platform_req.get("excluded_platforms", [])
         preferred_platforms = platform_req.get("preferred_platforms", [])
         
-        recommendations = []
-        
         # 检查是否在排除列表中
         if self.current_platform in excluded_platforms:
-            recommendations.append(f"请在以下平台运行: {required_platforms or preferred_platforms}")
             return {
                 "valid": False,
                 "reason": f"当前平台 {self.current_platform} 在排除列表中",
-                "recommendations": recommendations
+                "recommendations": [f"请在以下平台运行: {required_platforms or preferred_platforms}"]
             }
         
         # 检查是否满足必需平台要求
         if required_platforms and self.current_platform not in required_platforms:
-            recommendations.append(f"请切换到支持的平台: {required_platforms}")
             return {
                 "valid": False,
                 "reason": f"当前平台 {self.current_platform} 不在必需平台列表中: {required_platforms}",
-                "recommendations": recommendations
+                "recommendations": [f"请切换到支持的平台: {required_platforms}"]
             }
         
-        # 检查是否为首选平台
+        # 检查是否为首选平台（仅在需要时才生成建议）
+        recommendations = []
         if preferred_platforms and self.current_platform not in preferred_platforms:
             recommendations.append(f"建议使用首选平台以获得最佳性能: {preferred_platforms}")
         
@@ -368,66 +674,62 @@ class EnhancedPreconditionValidator:
         min_cpu_cores = resource_req.get("min_cpu_cores", 0)
         gpu_required = resource_req.get("gpu_required", False)
         min_disk_space = resource_req.get("min_disk_space_gb", 0)
-        
-        recommendations = []
+        system_resources = self.system_resources
         
         # 检查内存
-        if self.system_resources["memory_gb"] < min_memory:
-            recommendations.append(f"建议升级内存到至少 {min_memory}GB")
+        if system_resources["memory_gb"] < min_memory:
             return {
                 "valid": False,
-                "reason": f"内存不足: 需要 {min_memory}GB，当前 {self.system_resources['memory_gb']}GB",
-                "recommendations": recommendations
+                "reason": f"内存不足: 需要 {min_memory}GB，当前 {system_resources['memory_gb']:.2f}GB",
+                "recommendations": [f"建议升级内存到至少 {min_memory}GB"]
             }
         
         # 检查CPU核心数
-        if self.system_resources["cpu_cores"] < min_cpu_cores:
-            recommendations.append(f"建议使用至少 {min_cpu_cores} 核心的CPU")
+        if system_resources["cpu_cores"] < min_cpu_cores:
             return {
                 "valid": False,
-                "reason": f"CPU核心数不足: 需要 {min_cpu_cores}核，当前 {self.system_resources['cpu_cores']}核",
-                "recommendations": recommendations
+                "reason": f"CPU核心数不足: 需要 {min_cpu_cores}核，当前 {system_resources['cpu_cores']}核",
+                "recommendations": [f"建议使用至少 {min_cpu_cores} 核心的CPU"]
             }
         
         # 检查GPU
-        if gpu_required and not self.system_resources["gpu_available"]:
-            recommendations.append("安装支持的GPU驱动程序或使用带有GPU的机器")
+        if gpu_required and not system_resources["gpu_available"]:
             return {
                 "valid": False,
                 "reason": "需要GPU但系统中未检测到可用GPU",
-                "recommendations": recommendations
+                "recommendations": ["安装支持的GPU驱动程序或使用带有GPU的机器"]
             }
         
         # 检查磁盘空间
-        if min_disk_space > 0 and self.system_resources["disk_free_gb"] < min_disk_space:
-            recommendations.append(f"清理磁盘空间，至少需要 {min_disk_space}GB 可用空间")
+        if min_disk_space > 0 and system_resources["disk_free_gb"] < min_disk_space:
             return {
                 "valid": False,
-                "reason": f"磁盘空间不足: 需要 {min_disk_space}GB，当前可用 {self.system_resources['disk_free_gb']}GB",
-                "recommendations": recommendations
+                "reason": f"磁盘空间不足: 需要 {min_disk_space}GB，当前可用 {system_resources['disk_free_gb']:.2f}GB",
+                "recommendations": [f"清理磁盘空间，至少需要 {min_disk_space}GB 可用空间"]
             }
         
-        # 性能建议
-        if self.system_resources["memory_gb"] < min_memory * 1.5:
+        # 性能建议（仅在需要时才生成）
+        recommendations = []
+        if system_resources["memory_gb"] < min_memory * 1.5:
             recommendations.append(f"建议使用 {min_memory * 1.5}GB 内存以获得更好性能")
         
         return {
             "valid": True, 
             "reason": "资源要求满足",
-            "current_resources": self.system_resources,
+            "current_resources": system_resources,
             "recommendations": recommendations
         }
     
     def _validate_capabilities(self, capability_req: List[str]) -> Dict[str, Any]:
         """验证能力要求"""
-        missing_capabilities = []
         recommendations = []
         
-        for capability in capability_req:
-            if capability not in self.available_capabilities:
-                missing_capabilities.append(capability)
+        # 需求掩码中不在可用掩码内的位即为缺失能力
+        required_mask, unknown_capabilities = _capability_requirement_mask(tuple(capability_req))
+        missing_mask = required_mask & ~self._cap_mask
         
-        if missing_capabilities:
+        if missing_mask or unknown_capabilities:
+            missing_capabilities = list(_decode_capabilities(missing_mask) + unknown_capabilities)
             # 为缺失的能力提供建议
             for capability in missing_capabilities:
                 if capability == "ui_test":
@@ -451,7 +753,7 @@ class EnhancedPreconditionValidator:
         return {
             "valid": True, 
             "reason": "能力要求满足",
-            "available_capabilities": self.available_capabilities,
+            "available_capabilities": sorted(self.available_capabilities),
             "recommendations": recommendations
         }
     
@@ -509,17 +811,17 @@ class EnhancedPreconditionValidator:
         return True
     
     def _check_dependency_available(self, dependency: str) -> bool:
-        """检查依赖是否可用"""
-        # 这里可以添加具体的依赖检查逻辑
-        # 例如检查特定的软件包、服务或工具是否安装
-        return True
+        """检查依赖是否可用（PATH中的可执行文件或可导入的Python模块）"""
+        return _dependency_installed(dependency)
     
     def generate_system_report(self) -> Dict[str, Any]:
         """生成系统报告"""
+        from datetime import datetime
+        
         return {
             "platform": self.current_platform,
-            "system_resources": self.system_resources,
-            "available_capabilities": self.available_capabilities,
+            "system_resources": _format_resources(self.system_resources),
+            "available_capabilities": sorted(self.available_capabilities),
             "environment_info": self.environment_info,
             "framework_config": self.framework_config,
             "timestamp": str(datetime.now())
@@ -536,8 +838,8 @@ if __name__ == "__main__":
     print("🔍 PowerAutomation 前置条件验证器")
     print("=" * 50)
     print(f"当前平台: {validator.current_platform}")
-    print(f"系统资源: {validator.system_resources}")
-    print(f"可用能力: {validator.available_capabilities}")
+    print(f"系统资源: {_format_resources(validator.system_resources)}")
+    print(f"可用能力: {sorted(validator.available_capabilities)}")
     print(f"环境信息: {validator.environment_info}")
     
     # 测试示例前置条件
@@ -6,26 +6,112 @@ PowerAutomation 测试框架完整性验证和报告生成器
 """
 
 import os
+import re
 import sys
+import ast
 import json
-import yaml
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
+
+def _scandir_tests(root, include_conftest: bool = False) -> Iterator[str]:
+    """递归遍历目录，逐个产出 test_*.py 文件路径（复用DirEntry缓存的类型信息，不跟随目录符号链接）
+    
+    include_conftest为True时同时产出 conftest.py（测试通过其中的夹具使用共享组件）
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_tests(entry.path, include_conftest)
+            elif ((entry.name.startswith("test_") and entry.name.endswith(".py")) or
+                    (include_conftest and entry.name == "conftest.py")) and entry.is_file():
+                yield entry.path
+
+def _scan_inventory(root, prefix: str = "", inventory: Optional[Dict[str, os.DirEntry]] = None) -> Dict[str, os.DirEntry]:
+    """一次遍历目录树，返回 {以/分隔的相对路径: DirEntry}
+    
+    DirEntry 缓存了类型信息，stat() 结果也在首次调用后缓存，后续存在性和大小检查不再触发系统调用
+    """
+    if inventory is None:
+        inventory = {}
+    with os.scandir(root) as entries:
+        for entry in entries:
+            rel_path = prefix + entry.name
+            inventory[rel_path] = entry
+            if entry.is_dir(follow_symlinks=False):
+                _scan_inventory(entry.path, rel_path + "/", inventory)
+    return inventory
+
+# 逐文件读取检查使用的线程数（读取和stat期间释放GIL，I/O可以并发）
+_IO_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# 视觉测试集成组件（相对测试目录，以/分隔）
+_VISUAL_COMPONENTS = (
+    "powerautomation_visual_tester.py",
+    "visual_test_integrator.py",
+    "end_to_end/client_side/test_client_e2e_visual.py",
+    "end_to_end/fallback_automation/test_fallback_visual.py",
+    "visual_tests/visual_test_suite.py"
+)
+
+# 引用增强前置条件系统的标志（模块名或验证器类名），一次扫描同时匹配两者
+_PRECONDITION_REFERENCE_RE = re.compile(rb"enhanced_test_preconditions|EnhancedPreconditionValidator")
+
+@lru_cache(maxsize=32)
+def _check_syntax(file_path: str, mtime_ns: int, file_size: int) -> None:
+    """解析源文件检查语法（只做语法分析不生成字节码；按路径、修改时间和大小缓存，文件未变化时不重复解析）"""
+    with open(file_path, 'rb') as f:
+        ast.parse(f.read(), filename=file_path)
+
+def _references_preconditions(file_path: str) -> bool:
+    """文件内容是否引用了增强前置条件系统"""
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return False
+    return _PRECONDITION_REFERENCE_RE.search(content) is not None
 
 class PowerAutomationFrameworkValidator:
     """PowerAutomation测试框架验证器"""
     
-    def __init__(self):
+    def __init__(self, verbose_report: bool = False):
         self.test_dir = Path(__file__).parent
+        # 为False时报告只统计各测试层级的测试文件数，不列出文件
+        self.verbose_report = verbose_report
         self.validation_results = {}
         self.framework_components = {}
+        self._inventory: Optional[Dict[str, os.DirEntry]] = None
+    
+    @property
+    def inventory(self) -> Dict[str, os.DirEntry]:
+        """测试目录文件清单（首次访问时遍历一次）"""
+        if self._inventory is None:
+            self._inventory = _scan_inventory(self.test_dir)
+        return self._inventory
+    
+    def _exists(self, rel_path: str) -> bool:
+        """相对路径（以/分隔）是否存在于测试目录中"""
+        return rel_path in self.inventory
+    
+    def _list_dir_files(self, rel_dir: str, suffix: str) -> List[str]:
+        """列出目录下直接包含的指定后缀文件的相对路径"""
+        prefix = rel_dir + "/"
+        return [
+            rel_path for rel_path in self.inventory
+            if rel_path.startswith(prefix) and rel_path.endswith(suffix) and "/" not in rel_path[len(prefix):]
+        ]
         
     def validate_complete_framework(self) -> Dict[str, Any]:
         """验证完整的测试框架"""
         print("🔍 开始PowerAutomation测试框架完整性验证...")
         print("=" * 60)
         
+        # 每次验证前重新遍历一次测试目录，之后的存在性和大小检查均查询该清单
+        self._inventory = _scan_inventory(self.test_dir)
+        
         validation_report = {
             "validation_timestamp": datetime.now().isoformat(),
             "framework_version": "PowerAutomation v2.0",
@@ -101,55 +187,60 @@ class PowerAutomationFrameworkValidator:
             }
         }
         
-        for component_name, component_info in components.items():
-            file_path = self.test_dir / component_info["path"]
-            
-            if file_path.exists():
-                try:
-                    # 检查文件大小和基本语法
-                    file_size = file_path.stat().st_size
-                    if file_size > 0:
-                        # 尝试编译检查语法
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            compile(content, str(file_path), 'exec')
-                        
-                        component_info["status"] = "available"
-                        component_info["file_size"] = file_size
-                        print(f"  ✅ {component_info['description']}: 可用")
-                    else:
-                        component_info["status"] = "empty"
-                        print(f"  ⚠️ {component_info['description']}: 文件为空")
-                        
-                except SyntaxError as e:
-                    component_info["status"] = "syntax_error"
-                    component_info["error"] = str(e)
-                    print(f"  ❌ {component_info['description']}: 语法错误")
-                    
-                except Exception as e:
-                    component_info["status"] = "error"
-                    component_info["error"] = str(e)
-                    print(f"  ❌ {component_info['description']}: 检查失败")
-            else:
-                component_info["status"] = "missing"
-                print(f"  ❌ {component_info['description']}: 文件缺失")
+        # 各组件文件并发检查，结果按组件顺序输出
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            messages = list(executor.map(self._check_one_component, components.values()))
+        
+        for message in messages:
+            print(message)
         
         return components
     
+    def _check_one_component(self, component_info: Dict[str, Any]) -> str:
+        """检查单个组件文件并更新其状态，返回结果说明"""
+        entry = self.inventory.get(component_info["path"])
+        
+        if entry is None:
+            component_info["status"] = "missing"
+            return f"  ❌ {component_info['description']}: 文件缺失"
+        
+        try:
+            # 检查文件大小和基本语法
+            file_stat = entry.stat()
+            file_size = file_stat.st_size
+            if file_size > 0:
+                # 尝试解析检查语法
+                _check_syntax(entry.path, file_stat.st_mtime_ns, file_size)
+                
+                component_info["status"] = "available"
+                component_info["file_size"] = file_size
+                return f"  ✅ {component_info['description']}: 可用"
+            
+            component_info["status"] = "empty"
+            return f"  ⚠️ {component_info['description']}: 文件为空"
+            
+        except SyntaxError as e:
+            component_info["status"] = "syntax_error"
+            component_info["error"] = str(e)
+            return f"  ❌ {component_info['description']}: 语法错误"
+            
+        except Exception as e:
+            component_info["status"] = "error"
+            component_info["error"] = str(e)
+            return f"  ❌ {component_info['description']}: 检查失败"
+    
     def _validate_test_layers(self) -> Dict[str, Any]:
         """验证测试层级结构"""
         layers = {
             "level1": {
                 "path": "level1",
                 "description": "Level 1 - 基础单元测试",
-                "status": "unknown",
-                "test_files": []
+                "status": "unknown"
             },
             "level5": {
                 "path": "level5", 
                 "description": "Level 5 - 性能测试",
-                "status": "unknown",
-                "test_files": []
+                "status": "unknown"
             },
             "end_to_end": {
                 "path": "end_to_end",
@@ -160,32 +251,27 @@ class PowerAutomationFrameworkValidator:
         }
         
         for layer_name, layer_info in layers.items():
-            layer_path = self.test_dir / layer_info["path"]
+            layer_entry = self.inventory.get(layer_info["path"])
             
-            if layer_path.exists() and layer_path.is_dir():
+            if layer_entry is not None and layer_entry.is_dir():
+                layer_path = layer_entry.path
                 # 统计测试文件
-                test_files = list(layer_path.rglob("test_*.py"))
-                layer_info["test_files"] = [str(f.relative_to(self.test_dir)) for f in test_files]
-                layer_info["test_count"] = len(test_files)
+                self._collect_layer_tests(layer_path, layer_info)
                 
                 if layer_name == "end_to_end":
                     # 检查端到端子层级
                     sublayers = ["client_side", "server_side", "integration", "fallback_automation"]
                     for sublayer in sublayers:
-                        sublayer_path = layer_path / sublayer
-                        if sublayer_path.exists():
-                            sublayer_tests = list(sublayer_path.rglob("test_*.py"))
-                            layer_info["sublayers"][sublayer] = {
-                                "status": "available",
-                                "test_count": len(sublayer_tests),
-                                "test_files": [str(f.relative_to(self.test_dir)) for f in sublayer_tests]
-                            }
-                            print(f"  ✅ {sublayer}: {len(sublayer_tests)} 个测试文件")
+                        sublayer_entry = self.inventory.get(f"{layer_info['path']}/{sublayer}")
+                        if sublayer_entry is not None:
+                            sublayer_info = {"status": "available"}
+                            self._collect_layer_tests(sublayer_entry.path, sublayer_info)
+                            layer_info["sublayers"][sublayer] = sublayer_info
+                            print(f"  ✅ {sublayer}: {sublayer_info['test_count']} 个测试文件")
                         else:
                             layer_info["sublayers"][sublayer] = {
                                 "status": "missing",
-                                "test_count": 0,
-                                "test_files": []
+                                "test_count": 0
                             }
                             print(f"  ❌ {sublayer}: 目录缺失")
                 
@@ -198,6 +284,15 @@ class PowerAutomationFrameworkValidator:
         
         return layers
     
+    def _collect_layer_tests(self, layer_path: str, layer_info: Dict[str, Any]):
+        """统计目录下的测试文件数，详细报告模式下同时记录测试文件列表"""
+        if self.verbose_report:
+            test_files = [os.path.relpath(f, self.test_dir) for f in _scandir_tests(layer_path)]
+            layer_info["test_files"] = test_files
+            layer_info["test_count"] = len(test_files)
+        else:
+            layer_info["test_count"] = sum(1 for _ in _scandir_tests(layer_path))
+    
     def _validate_integrations(self) -> Dict[str, Any]:
         """验证集成状态"""
         integrations = {
@@ -249,15 +344,15 @@ class PowerAutomationFrameworkValidator:
     def _check_generator_integration(self) -> Dict[str, Any]:
         """检查测试用例生成器集成状态"""
         # 检查生成器是否被复制到兜底自动化目录
-        fallback_generator = self.test_dir / "end_to_end" / "fallback_automation" / "test_case_generator.py"
-        fallback_test_generator = self.test_dir / "end_to_end" / "fallback_automation" / "fallback_test_generator.py"
+        fallback_generator = self._exists("end_to_end/fallback_automation/test_case_generator.py")
+        fallback_test_generator = self._exists("end_to_end/fallback_automation/fallback_test_generator.py")
         
-        if fallback_generator.exists() and fallback_test_generator.exists():
+        if fallback_generator and fallback_test_generator:
             return {
                 "status": "integrated",
                 "details": "测试用例生成器已集成到兜底自动化测试"
             }
-        elif fallback_test_generator.exists():
+        elif fallback_test_generator:
             return {
                 "status": "partial",
                 "details": "兜底测试生成器存在，但原生成器未复制"
@@ -270,16 +365,9 @@ class PowerAutomationFrameworkValidator:
     
     def _check_visual_integration(self) -> Dict[str, Any]:
         """检查视觉测试集成状态"""
-        visual_components = [
-            self.test_dir / "powerautomation_visual_tester.py",
-            self.test_dir / "visual_test_integrator.py",
-            self.test_dir / "end_to_end" / "client_side" / "test_client_e2e_visual.py",
-            self.test_dir / "end_to_end" / "fallback_automation" / "test_fallback_visual.py",
-            self.test_dir / "visual_tests" / "visual_test_suite.py"
-        ]
-        
-        existing_components = sum(1 for component in visual_components if component.exists())
-        total_components = len(visual_components)
+        inventory = self.inventory
+        existing_components = sum(1 for component in _VISUAL_COMPONENTS if component in inventory)
+        total_components = len(_VISUAL_COMPONENTS)
         
         if existing_components == total_components:
             return {
@@ -299,26 +387,25 @@ class PowerAutomationFrameworkValidator:
     
     def _check_precondition_integration(self) -> Dict[str, Any]:
         """检查前置条件系统集成状态"""
-        precondition_file = self.test_dir / "enhanced_test_preconditions.py"
-        
-        if precondition_file.exists():
-            # 检查是否在其他测试文件中被引用
-            test_files = list(self.test_dir.rglob("test_*.py"))
-            references = 0
+        if self._exists("enhanced_test_preconditions.py"):
+            # 检查是否在测试文件或conftest夹具中被引用（只需判断是否存在引用，找到第一个即停止）
+            # 各文件并发读取，按遍历顺序取第一个引用文件，找到后取消尚未开始的读取
+            referencing_file = None
+            test_files = list(_scandir_tests(self.test_dir, include_conftest=True))
             
-            for test_file in test_files:
-                try:
-                    with open(test_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if "enhanced_test_preconditions" in content or "EnhancedPreconditionValidator" in content:
-                            references += 1
-                except:
-                    continue
+            executor = ThreadPoolExecutor(max_workers=_IO_WORKERS)
+            try:
+                for test_file, referenced in zip(test_files, executor.map(_references_preconditions, test_files)):
+                    if referenced:
+                        referencing_file = test_file
+                        break
+            finally:
+                executor.shutdown(cancel_futures=True)
             
-            if references > 0:
+            if referencing_file is not None:
                 return {
                     "status": "integrated",
-                    "details": f"前置条件系统被 {references} 个测试文件引用"
+                    "details": f"前置条件系统已被测试文件引用: {os.path.relpath(referencing_file, self.test_dir)}"
                 }
             else:
                 return {
@@ -333,11 +420,11 @@ class PowerAutomationFrameworkValidator:
     
     def _check_fallback_integration(self) -> Dict[str, Any]:
         """检查兜底自动化集成状态"""
-        fallback_dir = self.test_dir / "end_to_end" / "fallback_automation"
+        fallback_dir = "end_to_end/fallback_automation"
         
-        if fallback_dir.exists():
-            fallback_files = list(fallback_dir.glob("*.py"))
-            test_files = [f for f in fallback_files if f.name.startswith("test_")]
+        if self._exists(fallback_dir):
+            fallback_files = self._list_dir_files(fallback_dir, ".py")
+            test_files = [f for f in fallback_files if f.rpartition("/")[2].startswith("test_")]
             
             if len(test_files) > 0:
                 return {
@@ -374,15 +461,14 @@ class PowerAutomationFrameworkValidator:
             print("  ❌ Playwright 不可用")
         
         # 检查视觉测试器功能
-        visual_tester_path = self.test_dir / "powerautomation_visual_tester.py"
-        if visual_tester_path.exists():
+        if self._exists("powerautomation_visual_tester.py"):
             visual_validation["visual_tester_functional"] = True
             print("  ✅ 视觉测试器功能可用")
         else:
             print("  ❌ 视觉测试器不可用")
         
         # 检查演示执行结果
-        demo_reports = list(self.test_dir.glob("visual_tests_demo/reports/*.json"))
+        demo_reports = self._list_dir_files("visual_tests_demo/reports", ".json")
         if demo_reports:
             visual_validation["demo_execution"] = True
             visual_validation["report_generation"] = True
@@ -392,11 +478,11 @@ class PowerAutomationFrameworkValidator:
         
         # 检查集成完整性
         visual_integration_files = [
-            self.test_dir / "visual_test_integrator.py",
-            self.test_dir / "visual_tests" / "visual_test_config.yaml"
+            "visual_test_integrator.py",
+            "visual_tests/visual_test_config.yaml"
         ]
         
-        if all(f.exists() for f in visual_integration_files):
+        if all(self._exists(f) for f in visual_integration_files):
             visual_validation["integration_complete"] = True
             print("  ✅ 视觉测试集成完整")
         else:
@@ -600,7 +686,13 @@ class PowerAutomationFrameworkValidator:
         return recommendations
 
 if __name__ == "__main__":
-    validator = PowerAutomationFrameworkValidator()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='PowerAutomation 测试框架完整性验证')
+    parser.add_argument('--verbose-report', action='store_true', help='在报告中列出各测试层级的测试文件')
+    args = parser.parse_args()
+    
+    validator = PowerAutomationFrameworkValidator(verbose_report=args.verbose_report)
     
     # 执行完整性验证
     validation_report = validator.validate_complete_framework()
@@ -4,18 +4,23 @@
 
 测试ID: GNSS_API_001
 业务模块: BSP_GNSS
-生成时间: 2025-06-10 02:26:46
+生成时间: 2026-10-17 14:58:59
 """
 
 import unittest
 import subprocess
+import sys
 import json
-import requests
 import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+def _lazy_requests():
+    """延迟导入requests，仅在发起HTTP请求时加载"""
+    import requests
+    return requests
+
 class Test网络定位nlp权限管理api测试(unittest.TestCase):
     """
     网络定位NLP权限管理API测试
@@ -169,6 +174,7 @@ class Test网络定位nlp权限管理api测试(unittest.TestCase):
         try:
             print(f"🌐 API请求: {method} {url}")
             
+            requests = _lazy_requests()
             response = requests.request(method, url, timeout=30, **kwargs)
             
             api_result = {
@@ -197,7 +203,7 @@ class Test网络定位nlp权限管理api测试(unittest.TestCase):
     
     def save_api_result_screenshot(self, api_name: str, result: Dict[str, Any]):
         """保存API结果截图"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         screenshot_name = f"{self.test_id}_api_{self.api_call_counter:02d}_{timestamp}.json"
         screenshot_path = self.screenshots_dir / screenshot_name
         
@@ -232,12 +238,19 @@ class Test网络定位nlp权限管理api测试(unittest.TestCase):
         网络定位NLP权限管理API测试主测试方法
         
         API测试步骤:
-        # API步骤1: 执行ADB命令获取权限属性\n        # API步骤2: 查询网络位置服务包信息\n        # API步骤3: 获取网络位置服务权限详情
+        # API步骤1: 执行ADB命令获取权限属性
+        # API步骤2: 查询网络位置服务包信息
+        # API步骤3: 获取网络位置服务权限详情
         """
         
         try:
             # API测试步骤实现
-            # API步骤1: 执行ADB命令获取权限属性\n            self.execute_api_test_step(1, "执行ADB命令获取权限属性", "adb shell getprop | grep location", "命令成功执行，返回定位服务配置信息")\n            # API步骤2: 查询网络位置服务包信息\n            self.execute_api_test_step(2, "查询网络位置服务包信息", "adb shell pm list packages | grep location", "返回网络位置服务相关包信息")\n            # API步骤3: 获取网络位置服务权限详情\n            self.execute_api_test_step(3, "获取网络位置服务权限详情", "adb shell dumpsys package com.android.location | grep permission", "返回完整的权限列表和状态")
+            # API步骤1: 执行ADB命令获取权限属性
+            self.execute_api_test_step(1, "执行ADB命令获取权限属性", "adb shell getprop | grep location", "命令成功执行，返回定位服务配置信息")
+            # API步骤2: 查询网络位置服务包信息
+            self.execute_api_test_step(2, "查询网络位置服务包信息", "adb shell pm list packages | grep location", "返回网络位置服务相关包信息")
+            # API步骤3: 获取网络位置服务权限详情
+            self.execute_api_test_step(3, "获取网络位置服务权限详情", "adb shell dumpsys package com.android.location | grep permission", "返回完整的权限列表和状态")
             
             print("✅ API测试执行成功")
             
@@ -4,25 +4,21 @@
 
 测试ID: BT_OP_001
 业务模块: BSP_Bluetooth
-生成时间: 2025-06-10 02:26:46
+生成时间: 2026-10-17 14:58:59
 """
 
+import sys
 import unittest
 import time
-import subprocess
 import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
-# 导入测试工具
-try:
-    import uiautomator2 as u2
-    import pytest
-    from selenium import webdriver
-except ImportError as e:
-    print(f"请安装必要的测试依赖: {e}")
-    sys.exit(1)
+def _lazy_u2():
+    """延迟导入uiautomator2，避免批量收集测试时加载设备依赖"""
+    import uiautomator2
+    return uiautomator2
 
 class Test蓝牙页面半关切换功能测试(unittest.TestCase):
     """
@@ -103,6 +99,7 @@ class Test蓝牙页面半关切换功能测试(unittest.TestCase):
         """设置测试设备"""
         try:
             # 连接Android设备
+            u2 = _lazy_u2()
             cls.device = u2.connect()
             cls.device.healthcheck()
             
@@ -129,7 +126,7 @@ class Test蓝牙页面半关切换功能测试(unittest.TestCase):
     def take_screenshot(self, checkpoint_name: str, description: str = "") -> str:
         """截图并保存"""
         self.checkpoint_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         screenshot_name = f"{self.test_id}_checkpoint_{self.checkpoint_counter:02d}_{timestamp}.png"
         screenshot_path = self.screenshots_dir / screenshot_name
         
@@ -171,12 +168,19 @@ class Test蓝牙页面半关切换功能测试(unittest.TestCase):
         蓝牙页面半关切换功能测试主测试方法
         
         测试步骤:
-        # 步骤1: 下拉控制中心，点击蓝牙图标切换至半关状态\n        # 步骤2: 进入蓝牙设置页面\n        # 步骤3: 点击蓝牙开关按钮切换为全关
+        # 步骤1: 下拉控制中心，点击蓝牙图标切换至半关状态
+        # 步骤2: 进入蓝牙设置页面
+        # 步骤3: 点击蓝牙开关按钮切换为全关
         """
         
         try:
             # 测试步骤实现
-            # 步骤1: 下拉控制中心，点击蓝牙图标切换至半关状态\n            self.execute_test_step(1, "下拉控制中心，点击蓝牙图标切换至半关状态", "下拉控制中心 → 点击蓝牙图标", "蓝牙图标为半亮/半透明状态")\n            # 步骤2: 进入蓝牙设置页面\n            self.execute_test_step(2, "进入蓝牙设置页面", "设置 → 蓝牙 → 进入蓝牙设置页面", "页面标题显示蓝牙，开关控件可见")\n            # 步骤3: 点击蓝牙开关按钮切换为全关\n            self.execute_test_step(3, "点击蓝牙开关按钮切换为全关", "点击蓝牙设置页面的开关按钮", "开关显示为OFF状态，相关选项变灰")
+            # 步骤1: 下拉控制中心，点击蓝牙图标切换至半关状态
+            self.execute_test_step(1, "下拉控制中心，点击蓝牙图标切换至半关状态", "下拉控制中心 → 点击蓝牙图标", "蓝牙图标为半亮/半透明状态")
+            # 步骤2: 进入蓝牙设置页面
+            self.execute_test_step(2, "进入蓝牙设置页面", "设置 → 蓝牙 → 进入蓝牙设置页面", "页面标题显示蓝牙，开关控件可见")
+            # 步骤3: 点击蓝牙开关按钮切换为全关
+            self.execute_test_step(3, "点击蓝牙开关按钮切换为全关", "点击蓝牙设置页面的开关按钮", "开关显示为OFF状态，相关选项变灰")
             
             print("✅ 测试执行成功")
             
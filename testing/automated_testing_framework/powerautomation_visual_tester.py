@@ -12,23 +12,108 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 
 # 导入Playwright相关模块
 try:
     from playwright.sync_api import sync_playwright, Page, Browser, Playwright
-    from pixelmatch import pixelmatch
+    from pixelmatch.contrib.PIL import pixelmatch
     from PIL import Image
     PLAYWRIGHT_AVAILABLE = True
 except ImportError as e:
     print(f"警告: Playwright相关模块导入失败: {e}")
     PLAYWRIGHT_AVAILABLE = False
 
-# 导入测试框架组件
-sys.path.append(str(Path(__file__).parent))
+# NumPy可用时使用向量化像素比较，否则回退到逐像素的pixelmatch
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Numba可用时将差异掩码计算编译为单次遍历的机器码
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 导入测试框架组件（模块可能以包路径和顶层名两种方式导入，避免重复追加路径）
+_FRAMEWORK_DIR = str(Path(__file__).parent)
+if _FRAMEWORK_DIR not in sys.path:
+    sys.path.append(_FRAMEWORK_DIR)
 from enhanced_test_preconditions import EnhancedPreconditionValidator
 
+def _downsample_image(image: "Image.Image", factor: int) -> "Image.Image":
+    """按倍数对图片做盒式降采样（factor为1时原样返回）"""
+    return image.reduce(factor) if factor > 1 else image
+
+# 会话内缓存的已解码基线图片数量
+_BASELINE_CACHE_SIZE = 32
+
+@lru_cache(maxsize=_BASELINE_CACHE_SIZE)
+def _load_baseline_image(baseline_path: str, mtime_ns: int, downsample: int = 1) -> "Image.Image":
+    """加载、解码并降采样基线图片（按路径和修改时间缓存，基线更新后自动失效）"""
+    return _downsample_image(Image.open(baseline_path).convert("RGB"), downsample)
+
+# YIQ色差的最大可能值（与pixelmatch一致）
+_YIQ_MAX_DELTA = 35215
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _yiq_mismatch_mask(current, baseline, max_delta):
+        """逐行并行计算差异像素掩码，不创建中间数组"""
+        height, width = current.shape[0], current.shape[1]
+        mismatch_mask = np.zeros((height, width), dtype=np.bool_)
+        for row in prange(height):
+            for col in range(width):
+                r = float(current[row, col, 0]) - float(baseline[row, col, 0])
+                g = float(current[row, col, 1]) - float(baseline[row, col, 1])
+                b = float(current[row, col, 2]) - float(baseline[row, col, 2])
+                if r == 0.0 and g == 0.0 and b == 0.0:
+                    continue
+                y = r * 0.29889531 + g * 0.58662247 + b * 0.11448223
+                i = r * 0.59597799 - g * 0.27417610 - b * 0.32180189
+                q = r * 0.21147017 - g * 0.52261711 + b * 0.31114694
+                mismatch_mask[row, col] = 0.5053 * y * y + 0.299 * i * i + 0.1957 * q * q > max_delta
+        return mismatch_mask
+
+def _compute_mismatch_mask(img_current: "Image.Image", img_baseline: "Image.Image",
+                           threshold: float) -> "np.ndarray":
+    """计算差异像素掩码（YIQ色差判定与pixelmatch includeAA=True 时一致）"""
+    if NUMBA_AVAILABLE:
+        return _yiq_mismatch_mask(np.asarray(img_current), np.asarray(img_baseline),
+                                  _YIQ_MAX_DELTA * threshold * threshold)
+    
+    # 图片保持uint8，仅在相减时扩展为int16
+    delta = np.subtract(np.asarray(img_current), np.asarray(img_baseline), dtype=np.int16)
+    changed = delta.any(axis=-1)
+    mismatch_mask = np.zeros(changed.shape, dtype=bool)
+    
+    # 仅对发生变化的像素计算浮点色差
+    r, g, b = delta[changed].astype(np.float32).T
+    y = r * 0.29889531 + g * 0.58662247 + b * 0.11448223
+    i = r * 0.59597799 - g * 0.27417610 - b * 0.32180189
+    q = r * 0.21147017 - g * 0.52261711 + b * 0.31114694
+    mismatch_mask[changed] = (0.5053 * y * y + 0.299 * i * i + 0.1957 * q * q) > _YIQ_MAX_DELTA * threshold * threshold
+    return mismatch_mask
+
+def _render_diff_image(img_current: "Image.Image", mismatch_mask: "np.ndarray") -> "Image.Image":
+    """生成差异图片：差异像素标红，其余像素为与白色混合的灰度图"""
+    current = np.asarray(img_current, dtype=np.float32)
+    luminance = current[..., 0] * 0.29889531 + current[..., 1] * 0.58662247 + current[..., 2] * 0.11448223
+    gray = (255 + (luminance - 255) * 0.1).astype(np.uint8)
+    diff = np.empty(mismatch_mask.shape + (4,), dtype=np.uint8)
+    diff[..., 0] = gray
+    diff[..., 1] = gray
+    diff[..., 2] = gray
+    diff[..., 3] = 255
+    diff[mismatch_mask] = (255, 0, 0, 255)
+    return Image.fromarray(diff)
+
 @dataclass
 class VisualTestConfig:
     """视觉测试配置"""
@@ -41,6 +126,7 @@ class VisualTestConfig:
     auto_update_baseline: bool = False
     screenshot_format: str = "png"
     enable_animations: bool = False
+    diff_downsample: int = 1  # 像素比较前的降采样倍数（1表示按原图比较）
 
 @dataclass
 class VisualTestResult:
@@ -89,6 +175,9 @@ class PowerAutomationVisualTester:
         # 测试结果
         self.test_results: List[VisualTestResult] = []
         
+        # 基线图片预加载线程（与页面导航、截图重叠执行）
+        self._baseline_prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="baseline-prefetch")
+        
         # 前置条件验证器
         self.precondition_validator = EnhancedPreconditionValidator()
         
@@ -149,27 +238,7 @@ class PowerAutomationVisualTester:
                 raise ValueError(f"不支持的浏览器类型: {self.config.browser_type}")
             
             # 创建页面并设置视口
-            self.page = self.browser.new_page()
-            self.page.set_viewport_size({
-                "width": self.config.viewport_width,
-                "height": self.config.viewport_height
-            })
-            
-            # 禁用动画（如果配置要求）
-            if not self.config.enable_animations:
-                self.page.add_init_script("""
-                    // 禁用CSS动画和过渡
-                    const style = document.createElement('style');
-                    style.textContent = `
-                        *, *::before, *::after {
-                            animation-duration: 0s !important;
-                            animation-delay: 0s !important;
-                            transition-duration: 0s !important;
-                            transition-delay: 0s !important;
-                        }
-                    `;
-                    document.head.appendChild(style);
-                """)
+            self.new_context()
             
             print(f"✅ {self.config.browser_type}浏览器已启动 (headless={self.config.headless})")
             return True
@@ -178,6 +247,33 @@ class PowerAutomationVisualTester:
             print(f"❌ 浏览器启动失败: {e}")
             return False
     
+    def new_context(self, browser: Optional["Browser"] = None) -> "Page":
+        """在已启动的浏览器中创建独立的上下文和页面（无需重启浏览器）"""
+        browser = browser or self.browser
+        context = browser.new_context(viewport={
+            "width": self.config.viewport_width,
+            "height": self.config.viewport_height
+        })
+        self.page = context.new_page()
+        
+        # 禁用动画（如果配置要求）
+        if not self.config.enable_animations:
+            self.page.add_init_script("""
+                // 禁用CSS动画和过渡
+                const style = document.createElement('style');
+                style.textContent = `
+                    *, *::before, *::after {
+                        animation-duration: 0s !important;
+                        animation-delay: 0s !important;
+                        transition-duration: 0s !important;
+                        transition-delay: 0s !important;
+                    }
+                `;
+                document.head.appendChild(style);
+            """)
+        
+        return self.page
+    
     def stop_browser(self):
         """关闭浏览器"""
         try:
@@ -188,6 +284,10 @@ class PowerAutomationVisualTester:
             print("✅ 浏览器已关闭")
         except Exception as e:
             print(f"⚠️ 关闭浏览器时出现警告: {e}")
+        finally:
+            # 取消尚未开始的基线预加载并释放预加载线程（新线程池在下次提交任务时才创建线程）
+            self._baseline_prefetcher.shutdown(wait=False, cancel_futures=True)
+            self._baseline_prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="baseline-prefetch")
     
     def navigate_to(self, url: str, wait_until: str = "networkidle") -> bool:
         """导航到指定URL"""
@@ -260,8 +360,7 @@ class PowerAutomationVisualTester:
         if update_baseline is None:
             update_baseline = self.config.auto_update_baseline
         
-        baseline_filename = f"{test_name}_baseline.{self.config.screenshot_format}"
-        baseline_path = self.baseline_dir / baseline_filename
+        baseline_path = self._get_baseline_path(test_name)
         diff_filename = f"{test_name}_diff.{self.config.screenshot_format}"
         diff_path = self.diff_dir / diff_filename
         
@@ -310,14 +409,49 @@ class PowerAutomationVisualTester:
         
         return result
     
+    def _get_baseline_path(self, test_name: str) -> Path:
+        """获取测试对应的基线图片路径"""
+        return self.baseline_dir / f"{test_name}_baseline.{self.config.screenshot_format}"
+    
+    def _prefetch_baseline(self, test_name: str, update_baseline: bool = None) -> Optional[Future]:
+        """在后台线程中预先解码基线图片"""
+        if update_baseline is None:
+            update_baseline = self.config.auto_update_baseline
+        
+        baseline_path = self._get_baseline_path(test_name)
+        if update_baseline or not baseline_path.exists():
+            return None
+        
+        return self._baseline_prefetcher.submit(
+            _load_baseline_image, str(baseline_path), baseline_path.stat().st_mtime_ns,
+            self.config.diff_downsample
+        )
+    
+    def preload_baselines(self) -> List[Future]:
+        """在后台一次性预加载基线目录中的基线图片，后续比较直接命中内存缓存"""
+        if self.config.auto_update_baseline:
+            return []
+        
+        suffix = f"_baseline.{self.config.screenshot_format}"
+        with os.scandir(self.baseline_dir) as entries:
+            baseline_entries = [entry for entry in entries if entry.name.endswith(suffix)]
+        
+        return [
+            self._baseline_prefetcher.submit(
+                _load_baseline_image, entry.path, entry.stat().st_mtime_ns, self.config.diff_downsample
+            )
+            for entry in baseline_entries[:_BASELINE_CACHE_SIZE]
+        ]
+    
     def _perform_visual_comparison(self, result: VisualTestResult, 
                                  current_path: Path, baseline_path: Path, 
                                  diff_path: Path) -> VisualTestResult:
         """执行实际的视觉比较"""
         try:
-            # 打开图片
-            img_current = Image.open(current_path).convert("RGB")
-            img_baseline = Image.open(baseline_path).convert("RGB")
+            # 打开图片（按配置降采样以减少比较的像素数量）
+            img_current = _downsample_image(Image.open(current_path).convert("RGB"), self.config.diff_downsample)
+            img_baseline = _load_baseline_image(str(baseline_path), baseline_path.stat().st_mtime_ns,
+                                                self.config.diff_downsample)
             
             # 检查尺寸
             if img_current.size != img_baseline.size:
@@ -325,17 +459,19 @@ class PowerAutomationVisualTester:
                 print(f"❌ {result.error}")
                 return result
             
-            # 创建差异图片
-            img_diff = Image.new("RGBA", img_current.size)
-            
             # 执行像素比较
-            mismatched_pixels = pixelmatch(
-                img_current,
-                img_baseline,
-                output=img_diff,
-                threshold=self.config.visual_threshold,
-                includeAA=True
-            )
+            if NUMPY_AVAILABLE:
+                mismatch_mask = _compute_mismatch_mask(img_current, img_baseline, self.config.visual_threshold)
+                mismatched_pixels = int(np.count_nonzero(mismatch_mask))
+            else:
+                img_diff = Image.new("RGBA", img_current.size)
+                mismatched_pixels = pixelmatch(
+                    img_current,
+                    img_baseline,
+                    output=img_diff,
+                    threshold=self.config.visual_threshold,
+                    includeAA=True
+                )
             
             total_pixels = img_current.width * img_current.height
             mismatch_percentage = (mismatched_pixels / total_pixels) * 100
@@ -351,6 +487,8 @@ class PowerAutomationVisualTester:
                 print(f"✅ 视觉验证通过: {result.test_name} (差异: {mismatch_percentage:.2f}%)")
             else:
                 # 保存差异图片
+                if NUMPY_AVAILABLE:
+                    img_diff = _render_diff_image(img_current, mismatch_mask)
                 img_diff.save(diff_path)
                 result.diff_image = str(diff_path)
                 print(f"❌ 视觉验证失败: {result.test_name} (差异: {mismatch_percentage:.2f}%)")
@@ -369,6 +507,9 @@ class PowerAutomationVisualTester:
         """运行完整的视觉测试"""
         print(f"\n🧪 开始视觉测试: {test_name}")
         
+        # 页面加载期间预加载基线图片
+        baseline_future = self._prefetch_baseline(test_name, update_baseline)
+        
         # 导航到URL
         if not self.navigate_to(url):
             return VisualTestResult(
@@ -410,7 +551,9 @@ class PowerAutomationVisualTester:
                 execution_time=0.0
             )
         
-        # 视觉比较
+        # 视觉比较（等待基线预加载完成，避免重复解码）
+        if baseline_future:
+            wait([baseline_future])
         result = self.compare_visual(test_name, test_id or test_name, 
                                    screenshot_path, update_baseline)
         
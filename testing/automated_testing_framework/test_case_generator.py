@@ -6,22 +6,88 @@ PowerAutomation 测试用例生成器
 支持操作型和API型两种测试类型
 """
 
+import io
 import os
 import sys
 import json
 import yaml
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, get_args, get_origin
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 优先使用libyaml的C实现
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# 测试脚本模板目录（模板在模块导入时读取一次）
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+def _load_template(template_name: str) -> str:
+    """读取测试脚本模板"""
+    with open(TEMPLATE_DIR / template_name, 'r', encoding='utf-8') as f:
+        return f.read()
+
+_OP_TEMPLATE_SRC = _load_template("operation_test.py.tmpl")
+_API_TEMPLATE_SRC = _load_template("api_test.py.tmpl")
+
+def _write_file(path: str, data: bytes):
+    """以单次write系统调用写入整个文件内容"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _dump_indented(obj: Any) -> str:
+    """序列化为嵌入测试脚本的JSON（8空格缩进，保留非ASCII字符）"""
+    if not ORJSON_AVAILABLE:
+        return json.dumps(obj, indent=8, ensure_ascii=False)
+    
+    # orjson仅支持2空格缩进，按行将缩进放大4倍
+    text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    lines = []
+    for line in text.split("\n"):
+        content = line.lstrip(" ")
+        lines.append(" " * ((len(line) - len(content)) * 4) + content)
+    return "\n".join(lines)
+
+def _gen_to_dict(cls):
+    """在类定义时生成直线式to_dict方法，替代asdict的反射遍历（字段浅拷贝）"""
+    items = []
+    for field in fields(cls):
+        field_args = get_args(field.type)
+        if is_dataclass(field.type):
+            expr = f"self.{field.name}.to_dict()"
+        elif get_origin(field.type) is tuple and field_args and is_dataclass(field_args[0]):
+            expr = f"tuple(item.to_dict() for item in self.{field.name})"
+        else:
+            expr = f"self.{field.name}"
+        items.append(f"{field.name!r}: {expr}")
+    
+    namespace = {}
+    exec("def to_dict(self):\n    return {" + ", ".join(items) + "}\n", namespace)
+    cls.to_dict = namespace["to_dict"]
+    return cls
+
 class TestType(Enum):
     """测试类型枚举"""
     OPERATION = "操作型测试"
     API = "API型测试"
 
-@dataclass
+@_gen_to_dict
+@dataclass(slots=True, frozen=True)
 class EnvironmentConfig:
     """环境配置数据类"""
     hardware: Dict[str, Any]
@@ -29,7 +95,8 @@ class EnvironmentConfig:
     network: Dict[str, Any]
     permissions: Dict[str, Any]
 
-@dataclass
+@_gen_to_dict
+@dataclass(slots=True, frozen=True)
 class CheckPoint:
     """截图检查点数据类"""
     step_number: int
@@ -38,7 +105,8 @@ class CheckPoint:
     verification_criteria: str
     api_call: Optional[str] = None
 
-@dataclass
+@_gen_to_dict
+@dataclass(slots=True, frozen=True)
 class TestCase:
     """测试用例数据类"""
     test_id: str
@@ -46,508 +114,65 @@ class TestCase:
     test_type: TestType
     business_module: str
     description: str
-    purpose: List[str]
+    purpose: Tuple[str, ...]
     environment_config: EnvironmentConfig
-    preconditions: List[str]
-    test_steps: List[Dict[str, Any]]
-    checkpoints: List[CheckPoint]
-    expected_results: List[str]
-    failure_criteria: List[str]
+    preconditions: Tuple[str, ...]
+    test_steps: Tuple[Dict[str, Any], ...]
+    checkpoints: Tuple[CheckPoint, ...]
+    expected_results: Tuple[str, ...]
+    failure_criteria: Tuple[str, ...]
+
+# 方法名中的空格和连字符统一替换为下划线
+_METHOD_NAME_TRANS = str.maketrans(" -", "__")
 
 class TestCaseGenerator:
     """测试用例生成器"""
     
+    # 测试脚本模板（类级常量，所有实例共享）
+    _OP_TEMPLATE = _OP_TEMPLATE_SRC
+    _API_TEMPLATE = _API_TEMPLATE_SRC
+    
     def __init__(self, output_dir: str = "generated_tests"):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
         
-        # 创建子目录
-        (self.output_dir / "operation_tests").mkdir(exist_ok=True)
-        (self.output_dir / "api_tests").mkdir(exist_ok=True)
-        (self.output_dir / "screenshots").mkdir(exist_ok=True)
-        (self.output_dir / "configs").mkdir(exist_ok=True)
-    
-    def generate_operation_test_template(self) -> str:
-        """生成操作型测试模板"""
-        template = '''#!/usr/bin/env python3
-"""
-{test_name} - 操作型测试
-
-测试ID: {test_id}
-业务模块: {business_module}
-生成时间: {generation_time}
-"""
-
-import unittest
-import time
-import subprocess
-import json
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
-
-# 导入测试工具
-try:
-    import uiautomator2 as u2
-    import pytest
-    from selenium import webdriver
-except ImportError as e:
-    print(f"请安装必要的测试依赖: {{e}}")
-    sys.exit(1)
-
-class Test{class_name}(unittest.TestCase):
-    """
-    {test_name}
-    
-    测试描述: {description}
-    测试目的: {purpose}
-    """
-    
-    @classmethod
-    def setUpClass(cls):
-        """测试类初始化"""
-        cls.device = None
-        cls.screenshots_dir = Path("screenshots/{test_id}")
-        cls.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        # 创建输出目录及子目录
+        base_dir = str(output_dir)
+        for subdir in ("operation_tests", "api_tests", "screenshots", "configs"):
+            os.makedirs(os.path.join(base_dir, subdir), exist_ok=True)
         
-        # 环境验证
-        cls.verify_environment()
+        # 预先拼接保存目录，避免每次保存时构造Path
+        self._op_dir = os.path.join(base_dir, "operation_tests")
+        self._api_dir = os.path.join(base_dir, "api_tests")
+        self._config_dir = os.path.join(base_dir, "configs")
         
-        # 设备连接
-        cls.setup_device()
+        # 测试类型 -> 渲染函数，避免每次渲染时分支判断
+        self._renderers = {
+            TestType.OPERATION: self._render_operation,
+            TestType.API: self._render_api
+        }
     
     @classmethod
-    def tearDownClass(cls):
-        """测试类清理"""
-        if cls.device:
-            cls.device.app_stop_all()
-    
-    def setUp(self):
-        """每个测试前的准备"""
-        self.test_start_time = datetime.now()
-        self.checkpoint_counter = 0
-        
-        # 验证前置条件
-        self.verify_preconditions()
-    
-    def tearDown(self):
-        """每个测试后的清理"""
-        test_duration = datetime.now() - self.test_start_time
-        print(f"测试耗时: {{test_duration.total_seconds():.2f}}秒")
+    def generate_operation_test_template(cls) -> str:
+        """生成操作型测试模板"""
+        return cls._OP_TEMPLATE
     
     @classmethod
-    def verify_environment(cls):
-        """验证环境配置"""
-        # 硬件环境验证
-        hardware_requirements = {hardware_config}
-        
-        # 软件环境验证  
-        software_requirements = {software_config}
-        
-        # 网络环境验证
-        network_requirements = {network_config}
-        
-        # 权限验证
-        permission_requirements = {permission_config}
-        
-        # TODO: 实现具体的环境验证逻辑
-        print("✅ 环境验证通过")
-    
-    @classmethod 
-    def setup_device(cls):
-        """设置测试设备"""
-        try:
-            # 连接Android设备
-            cls.device = u2.connect()
-            cls.device.healthcheck()
-            
-            # 获取设备信息
-            device_info = cls.device.device_info
-            print(f"连接设备: {{device_info.get('brand')}} {{device_info.get('model')}}")
-            
-        except Exception as e:
-            raise Exception(f"设备连接失败: {{e}}")
-    
-    def verify_preconditions(self):
-        """验证测试前置条件"""
-        preconditions = {preconditions}
-        
-        for condition in preconditions:
-            # TODO: 实现具体的前置条件验证
-            print(f"✅ 前置条件验证: {{condition}}")
-    
-    def take_screenshot(self, checkpoint_name: str, description: str = "") -> str:
-        """截图并保存"""
-        self.checkpoint_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_name = f"{{self.test_id}}_checkpoint_{{self.checkpoint_counter:02d}}_{{timestamp}}.png"
-        screenshot_path = self.screenshots_dir / screenshot_name
-        
-        try:
-            # 使用uiautomator2截图
-            self.device.screenshot(screenshot_path)
-            
-            # 记录截图信息
-            screenshot_info = {{
-                "checkpoint": self.checkpoint_counter,
-                "name": checkpoint_name,
-                "description": description,
-                "file": str(screenshot_path),
-                "timestamp": timestamp
-            }}
-            
-            print(f"📸 截图保存: {{screenshot_name}} - {{description}}")
-            return str(screenshot_path)
-            
-        except Exception as e:
-            print(f"❌ 截图失败: {{e}}")
-            return ""
-    
-    def verify_ui_element(self, element_selector: str, expected_state: str) -> bool:
-        """验证UI元素状态"""
-        try:
-            element = self.device(text=element_selector)
-            if element.exists:
-                # TODO: 根据expected_state验证元素状态
-                return True
-            else:
-                return False
-        except Exception as e:
-            print(f"UI元素验证失败: {{e}}")
-            return False
-    
-    def test_{method_name}(self):
-        """
-        {test_name}主测试方法
-        
-        测试步骤:
-{test_steps_comments}
-        """
-        
-        try:
-            # 测试步骤实现
-{test_steps_implementation}
-            
-            print("✅ 测试执行成功")
-            
-        except Exception as e:
-            self.fail(f"测试执行失败: {{e}}")
-    
-    def execute_test_step(self, step_number: int, description: str, action: str, verification: str):
-        """执行单个测试步骤"""
-        print(f"\\n--- 步骤{{step_number}}: {{description}} ---")
-        
-        try:
-            # 执行操作
-            if "点击" in action:
-                # TODO: 实现点击操作
-                pass
-            elif "输入" in action:
-                # TODO: 实现输入操作  
-                pass
-            elif "滑动" in action:
-                # TODO: 实现滑动操作
-                pass
-            
-            # 截图验证
-            screenshot_path = self.take_screenshot(f"step_{{step_number}}", description)
-            
-            # 验证结果
-            # TODO: 实现具体的验证逻辑
-            
-            print(f"✅ 步骤{{step_number}}执行成功")
-            
-        except Exception as e:
-            print(f"❌ 步骤{{step_number}}执行失败: {{e}}")
-            raise
-
-def run_test():
-    """运行测试"""
-    suite = unittest.TestLoader().loadTestsFromTestCase(Test{class_name})
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
-
-if __name__ == '__main__':
-    success = run_test()
-    if success:
-        print("\\n🎉 测试全部通过!")
-    else:
-        print("\\n❌ 测试存在失败")
-        sys.exit(1)
-'''
-        return template
-    
-    def generate_api_test_template(self) -> str:
+    def generate_api_test_template(cls) -> str:
         """生成API型测试模板"""
-        template = '''#!/usr/bin/env python3
-"""
-{test_name} - API型测试
-
-测试ID: {test_id}
-业务模块: {business_module}
-生成时间: {generation_time}
-"""
-
-import unittest
-import subprocess
-import json
-import requests
-import time
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-
-class Test{class_name}(unittest.TestCase):
-    """
-    {test_name}
-    
-    测试描述: {description}
-    测试目的: {purpose}
-    """
-    
-    @classmethod
-    def setUpClass(cls):
-        """测试类初始化"""
-        cls.adb_available = False
-        cls.api_base_url = ""
-        cls.screenshots_dir = Path("screenshots/{test_id}")
-        cls.screenshots_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 环境验证
-        cls.verify_environment()
-        
-        # ADB连接验证
-        cls.setup_adb_connection()
-    
-    def setUp(self):
-        """每个测试前的准备"""
-        self.test_start_time = datetime.now()
-        self.api_call_counter = 0
-        
-        # 验证前置条件
-        self.verify_preconditions()
-    
-    def tearDown(self):
-        """每个测试后的清理"""
-        test_duration = datetime.now() - self.test_start_time
-        print(f"测试耗时: {{test_duration.total_seconds():.2f}}秒")
-    
-    @classmethod
-    def verify_environment(cls):
-        """验证环境配置"""
-        # 环境配置验证
-        environment_config = {environment_config}
-        
-        # TODO: 实现具体的环境验证逻辑
-        print("✅ 环境验证通过")
-    
-    @classmethod
-    def setup_adb_connection(cls):
-        """设置ADB连接"""
-        try:
-            # 检查ADB可用性
-            result = subprocess.run(['adb', 'devices'], 
-                                  capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and 'device' in result.stdout:
-                cls.adb_available = True
-                print("✅ ADB连接正常")
-            else:
-                raise Exception("ADB设备未连接")
-                
-        except Exception as e:
-            raise Exception(f"ADB连接失败: {{e}}")
-    
-    def verify_preconditions(self):
-        """验证测试前置条件"""
-        preconditions = {preconditions}
-        
-        for condition in preconditions:
-            # TODO: 实现具体的前置条件验证
-            print(f"✅ 前置条件验证: {{condition}}")
-    
-    def execute_adb_command(self, command: str, timeout: int = 30) -> Dict[str, Any]:
-        """执行ADB命令"""
-        self.api_call_counter += 1
-        
-        try:
-            print(f"🔧 执行ADB命令: {{command}}")
-            
-            result = subprocess.run(
-                command.split(),
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            api_result = {{
-                "command": command,
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "success": result.returncode == 0,
-                "timestamp": datetime.now().isoformat()
-            }}
-            
-            # 保存API调用结果截图
-            self.save_api_result_screenshot(command, api_result)
-            
-            if api_result["success"]:
-                print(f"✅ ADB命令执行成功")
-            else:
-                print(f"❌ ADB命令执行失败: {{result.stderr}}")
-            
-            return api_result
-            
-        except subprocess.TimeoutExpired:
-            return {{
-                "command": command,
-                "success": False,
-                "error": "命令执行超时",
-                "timestamp": datetime.now().isoformat()
-            }}
-        except Exception as e:
-            return {{
-                "command": command,
-                "success": False,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }}
-    
-    def make_api_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
-        """发起API请求"""
-        self.api_call_counter += 1
-        
-        try:
-            print(f"🌐 API请求: {{method}} {{url}}")
-            
-            response = requests.request(method, url, timeout=30, **kwargs)
-            
-            api_result = {{
-                "method": method,
-                "url": url,
-                "status_code": response.status_code,
-                "success": response.status_code < 400,
-                "response_data": response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text,
-                "headers": dict(response.headers),
-                "timestamp": datetime.now().isoformat()
-            }}
-            
-            # 保存API响应截图
-            self.save_api_result_screenshot(f"{{method}} {{url}}", api_result)
-            
-            return api_result
-            
-        except Exception as e:
-            return {{
-                "method": method,
-                "url": url,
-                "success": False,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }}
-    
-    def save_api_result_screenshot(self, api_name: str, result: Dict[str, Any]):
-        """保存API结果截图"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_name = f"{{self.test_id}}_api_{{self.api_call_counter:02d}}_{{timestamp}}.json"
-        screenshot_path = self.screenshots_dir / screenshot_name
-        
-        try:
-            with open(screenshot_path, 'w', encoding='utf-8') as f:
-                json.dump({{
-                    "api_name": api_name,
-                    "result": result
-                }}, f, ensure_ascii=False, indent=2)
-            
-            print(f"📸 API结果保存: {{screenshot_name}}")
-            
-        except Exception as e:
-            print(f"❌ API结果保存失败: {{e}}")
-    
-    def verify_api_response(self, response: Dict[str, Any], expected_fields: List[str]) -> bool:
-        """验证API响应格式"""
-        if not response.get("success"):
-            return False
-        
-        response_data = response.get("response_data", {{}})
-        
-        for field in expected_fields:
-            if field not in response_data:
-                print(f"❌ 缺少必需字段: {{field}}")
-                return False
-        
-        return True
-    
-    def test_{method_name}(self):
-        """
-        {test_name}主测试方法
-        
-        API测试步骤:
-{api_steps_comments}
-        """
-        
-        try:
-            # API测试步骤实现
-{api_steps_implementation}
-            
-            print("✅ API测试执行成功")
-            
-        except Exception as e:
-            self.fail(f"API测试执行失败: {{e}}")
-    
-    def execute_api_test_step(self, step_number: int, description: str, api_call: str, verification: str):
-        """执行单个API测试步骤"""
-        print(f"\\n--- API步骤{{step_number}}: {{description}} ---")
-        
-        try:
-            # 执行API调用
-            if api_call.startswith('adb'):
-                result = self.execute_adb_command(api_call)
-            else:
-                # HTTP API调用
-                result = self.make_api_request('GET', api_call)
-            
-            # 验证结果
-            self.assertTrue(result.get("success"), f"API调用失败: {{result.get('error', 'Unknown error')}}")
-            
-            # TODO: 实现具体的验证逻辑
-            
-            print(f"✅ API步骤{{step_number}}执行成功")
-            
-        except Exception as e:
-            print(f"❌ API步骤{{step_number}}执行失败: {{e}}")
-            raise
-
-def run_test():
-    """运行测试"""
-    suite = unittest.TestLoader().loadTestsFromTestCase(Test{class_name})
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
-
-if __name__ == '__main__':
-    success = run_test()
-    if success:
-        print("\\n🎉 API测试全部通过!")
-    else:
-        print("\\n❌ API测试存在失败")
-        sys.exit(1)
-'''
-        return template
+        return cls._API_TEMPLATE
     
     def generate_test_from_template(self, test_case: TestCase) -> str:
         """根据测试用例生成Python脚本"""
+        return self._renderers[test_case.test_type](test_case)
+    
+    def _build_common_vars(self, test_case: TestCase) -> Dict[str, str]:
+        """准备两类模板共用的模板变量"""
         
         # 生成类名
-        class_name = "".join([word.capitalize() for word in test_case.test_name.replace(" ", "_").split("_")])
-        method_name = test_case.test_name.lower().replace(" ", "_").replace("-", "_")
+        class_name = "".join(map(str.capitalize, test_case.test_name.replace(" ", "_").split("_")))
+        method_name = test_case.test_name.lower().translate(_METHOD_NAME_TRANS)
         
-        # 准备模板变量
-        template_vars = {
+        return {
             "test_id": test_case.test_id,
             "test_name": test_case.test_name,
             "business_module": test_case.business_module,
@@ -555,66 +180,73 @@ if __name__ == '__main__':
             "purpose": "\\n    ".join([f"- {p}" for p in test_case.purpose]),
             "class_name": class_name,
             "method_name": method_name,
-            "generation_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "hardware_config": json.dumps(test_case.environment_config.hardware, indent=8, ensure_ascii=False),
-            "software_config": json.dumps(test_case.environment_config.software, indent=8, ensure_ascii=False),
-            "network_config": json.dumps(test_case.environment_config.network, indent=8, ensure_ascii=False),
-            "permission_config": json.dumps(test_case.environment_config.permissions, indent=8, ensure_ascii=False),
-            "environment_config": json.dumps(asdict(test_case.environment_config), indent=8, ensure_ascii=False),
-            "preconditions": json.dumps(test_case.preconditions, indent=8, ensure_ascii=False)
+            "generation_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "preconditions": _dump_indented(test_case.preconditions)
         }
+    
+    def _render_operation(self, test_case: TestCase) -> str:
+        """渲染操作型测试脚本"""
+        template_vars = self._build_common_vars(test_case)
+        env = test_case.environment_config
+        template_vars["hardware_config"] = _dump_indented(env.hardware)
+        template_vars["software_config"] = _dump_indented(env.software)
+        template_vars["network_config"] = _dump_indented(env.network)
+        template_vars["permission_config"] = _dump_indented(env.permissions)
         
         # 生成测试步骤
-        if test_case.test_type == TestType.OPERATION:
-            template_vars["test_steps_comments"] = "\\n".join([
-                f"        # 步骤{i+1}: {step.get('description', '')}"
-                for i, step in enumerate(test_case.test_steps)
-            ])
-            
-            template_vars["test_steps_implementation"] = "\\n".join([
-                f"            # 步骤{i+1}: {step.get('description', '')}\\n"
-                f"            self.execute_test_step({i+1}, \"{step.get('description', '')}\", \"{step.get('action', '')}\", \"{step.get('verification', '')}\")"
-                for i, step in enumerate(test_case.test_steps)
-            ])
-            
-            template = self.generate_operation_test_template()
-            
-        else:  # API测试
-            template_vars["api_steps_comments"] = "\\n".join([
-                f"        # API步骤{i+1}: {step.get('description', '')}"
-                for i, step in enumerate(test_case.test_steps)
-            ])
-            
-            template_vars["api_steps_implementation"] = "\\n".join([
-                f"            # API步骤{i+1}: {step.get('description', '')}\\n"
-                f"            self.execute_api_test_step({i+1}, \"{step.get('description', '')}\", \"{step.get('api_call', '')}\", \"{step.get('verification', '')}\")"
-                for i, step in enumerate(test_case.test_steps)
-            ])
-            
-            template = self.generate_api_test_template()
+        comments, implementations = io.StringIO(), io.StringIO()
+        for i, step in enumerate(test_case.test_steps, 1):
+            description = step.get('description', '')
+            action = step.get('action', '')
+            verification = step.get('verification', '')
+            comments.write(f"        # 步骤{i}: {description}\n")
+            implementations.write(
+                f"            # 步骤{i}: {description}\n"
+                f"            self.execute_test_step({i}, \"{description}\", \"{action}\", \"{verification}\")\n"
+            )
         
-        # 填充模板
-        return template.format(**template_vars)
+        template_vars["test_steps_comments"] = comments.getvalue().rstrip("\n")
+        template_vars["test_steps_implementation"] = implementations.getvalue().rstrip("\n")
+        
+        return self._OP_TEMPLATE.format_map(template_vars)
+    
+    def _render_api(self, test_case: TestCase) -> str:
+        """渲染API型测试脚本"""
+        template_vars = self._build_common_vars(test_case)
+        template_vars["environment_config"] = _dump_indented(test_case.environment_config.to_dict())
+        
+        # 生成API测试步骤
+        comments, implementations = io.StringIO(), io.StringIO()
+        for i, step in enumerate(test_case.test_steps, 1):
+            description = step.get('description', '')
+            api_call = step.get('api_call', '')
+            verification = step.get('verification', '')
+            comments.write(f"        # API步骤{i}: {description}\n")
+            implementations.write(
+                f"            # API步骤{i}: {description}\n"
+                f"            self.execute_api_test_step({i}, \"{description}\", \"{api_call}\", \"{verification}\")\n"
+            )
+        
+        template_vars["api_steps_comments"] = comments.getvalue().rstrip("\n")
+        template_vars["api_steps_implementation"] = implementations.getvalue().rstrip("\n")
+        
+        return self._API_TEMPLATE.format_map(template_vars)
     
     def save_test_script(self, test_case: TestCase, script_content: str) -> str:
         """保存测试脚本到文件"""
         
         # 确定保存目录
-        if test_case.test_type == TestType.OPERATION:
-            save_dir = self.output_dir / "operation_tests"
-        else:
-            save_dir = self.output_dir / "api_tests"
+        save_dir = self._op_dir if test_case.test_type == TestType.OPERATION else self._api_dir
         
         # 生成文件名
         filename = f"test_{test_case.test_id.lower()}.py"
-        file_path = save_dir / filename
+        file_path = os.path.join(save_dir, filename)
         
         # 保存文件
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(script_content)
+        _write_file(file_path, script_content.encode('utf-8'))
         
         print(f"✅ 测试脚本已生成: {file_path}")
-        return str(file_path)
+        return file_path
     
     def generate_config_file(self, test_case: TestCase) -> str:
         """生成测试配置文件"""
@@ -625,20 +257,20 @@ if __name__ == '__main__':
                 "test_type": test_case.test_type.value,
                 "business_module": test_case.business_module
             },
-            "environment": asdict(test_case.environment_config),
+            "environment": test_case.environment_config.to_dict(),
             "preconditions": test_case.preconditions,
             "expected_results": test_case.expected_results,
             "failure_criteria": test_case.failure_criteria
         }
         
         config_filename = f"{test_case.test_id.lower()}_config.yaml"
-        config_path = self.output_dir / "configs" / config_filename
+        config_path = os.path.join(self._config_dir, config_filename)
         
-        with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+        config_content = yaml.dump(config_data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        _write_file(config_path, config_content.encode('utf-8'))
         
         print(f"✅ 配置文件已生成: {config_path}")
-        return str(config_path)
+        return config_path
 
 def create_sample_test_cases() -> List[TestCase]:
     """创建示例测试用例"""
@@ -650,11 +282,11 @@ def create_sample_test_cases() -> List[TestCase]:
         test_type=TestType.OPERATION,
         business_module="BSP_Bluetooth",
         description="验证蓝牙设置页面中半关状态与全关/全开状态之间的切换功能",
-        purpose=[
+        purpose=(
             "验证蓝牙状态切换的用户界面交互正确性",
             "确保蓝牙半关、全关、全开三种状态转换的稳定性",
             "测试重复操作的一致性和可靠性"
-        ],
+        ),
         environment_config=EnvironmentConfig(
             hardware={
                 "device_type": "Android手机",
@@ -677,13 +309,13 @@ def create_sample_test_cases() -> List[TestCase]:
                 "system_app_access": True
             }
         ),
-        preconditions=[
+        preconditions=(
             "设备已开机并解锁进入主界面",
             "蓝牙功能正常可用且初始状态为全开",
             "控制中心可正常下拉访问",
             "蓝牙设置页面可正常进入"
-        ],
-        test_steps=[
+        ),
+        test_steps=(
             {
                 "step": 1,
                 "description": "下拉控制中心，点击蓝牙图标切换至半关状态",
@@ -702,22 +334,22 @@ def create_sample_test_cases() -> List[TestCase]:
                 "action": "点击蓝牙设置页面的开关按钮",
                 "verification": "开关显示为OFF状态，相关选项变灰"
             }
-        ],
-        checkpoints=[
+        ),
+        checkpoints=(
             CheckPoint(1, "控制中心蓝牙图标半关状态", "bt_op_001_checkpoint_01.png", "图标半透明显示"),
             CheckPoint(2, "蓝牙设置页面显示", "bt_op_001_checkpoint_02.png", "页面正常显示"),
             CheckPoint(3, "蓝牙全关状态", "bt_op_001_checkpoint_03.png", "开关OFF状态")
-        ],
-        expected_results=[
+        ),
+        expected_results=(
             "蓝牙图标呈现半透明或带有特殊半关标识",
             "蓝牙设置页面正常显示，开关为半关状态", 
             "开关显示为关闭状态，蓝牙相关选项全部变灰"
-        ],
-        failure_criteria=[
+        ),
+        failure_criteria=(
             "任何状态切换不符合预期",
             "界面显示异常或卡顿",
             "重复测试结果不一致"
-        ]
+        )
     )
     
     # 网络定位API测试用例
@@ -727,11 +359,11 @@ def create_sample_test_cases() -> List[TestCase]:
         test_type=TestType.API,
         business_module="BSP_GNSS",
         description="通过ADB命令和系统API验证网络位置服务的权限管理功能",
-        purpose=[
+        purpose=(
             "验证网络定位服务权限API的正确性",
             "确保权限信息通过系统接口正确获取",
             "测试权限管理界面与API数据的一致性"
-        ],
+        ),
         environment_config=EnvironmentConfig(
             hardware={
                 "device_type": "Android手机",
@@ -754,13 +386,13 @@ def create_sample_test_cases() -> List[TestCase]:
                 "usb_debugging": True
             }
         ),
-        preconditions=[
+        preconditions=(
             "设备通过USB连接并被ADB识别",
             "网络位置服务已安装且可访问",
             "设备具有基本的定位权限",
             "系统设置应用可正常访问"
-        ],
-        test_steps=[
+        ),
+        test_steps=(
             {
                 "step": 1,
                 "description": "执行ADB命令获取权限属性",
@@ -779,22 +411,22 @@ def create_sample_test_cases() -> List[TestCase]:
                 "api_call": "adb shell dumpsys package com.android.location | grep permission",
                 "verification": "返回完整的权限列表和状态"
             }
-        ],
-        checkpoints=[
+        ),
+        checkpoints=(
             CheckPoint(1, "权限属性查询结果", "gnss_api_001_checkpoint_01.json", "返回location相关属性", "adb shell getprop"),
             CheckPoint(2, "包信息查询结果", "gnss_api_001_checkpoint_02.json", "返回位置服务包", "adb shell pm list packages"),
             CheckPoint(3, "权限详情查询结果", "gnss_api_001_checkpoint_03.json", "返回权限列表", "adb shell dumpsys package")
-        ],
-        expected_results=[
+        ),
+        expected_results=(
             "命令返回包含location相关的系统属性配置",
             "成功查询到网络位置服务包，包名正确",
             "权限详情包含ACCESS_FINE_LOCATION等权限项目"
-        ],
-        failure_criteria=[
+        ),
+        failure_criteria=(
             "ADB命令执行失败或返回错误",
             "权限信息不完整或不正确",
             "API数据格式不符合预期"
-        ]
+        )
     )
     
     return [bluetooth_test, location_test]
@@ -812,6 +444,7 @@ def main():
     
     generated_files = []
     
+    # 示例用例数量很少，在同一生成器中依次生成，避免启动进程池的开销
     for test_case in test_cases:
         print(f"\\n📝 生成测试用例: {test_case.test_name}")
         
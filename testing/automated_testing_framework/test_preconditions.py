@@ -7,18 +7,123 @@ PowerAutomation 前置条件验证器
 
 import os
 import sys
+import atexit
 import platform
 import psutil
 import subprocess
+from functools import cache, cached_property
+from multiprocessing import resource_tracker, shared_memory
 from typing import Dict, List, Any, Optional
 
+# GPU探测结果在进程间共享：pytest控制进程启动时探测一次并写入共享内存，各xdist worker只读取
+# 共享内存名称包含用户标识，避免不同用户的会话互相读取（/dev/shm中的段仅创建者可访问）
+_GPU_SHM_NAME = f"powerauto_gpu_probe_{os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', '')}"
+
+# 共享内存中的探测状态（新建的共享内存初始为0，即尚未写入结果）
+_GPU_PROBE_PENDING = 0
+_GPU_PROBE_ABSENT = 1
+_GPU_PROBE_PRESENT = 2
+
+# nvidia-smi的超时秒数（驱动挂起时视为无GPU）
+_NVIDIA_SMI_TIMEOUT = 5
+
+# 本进程发布的GPU探测结果（仅发布方进程设置）
+_published_gpu_probe: Optional[bool] = None
+
+def _probe_gpu() -> bool:
+    """探测GPU可用性"""
+    try:
+        # 尝试检测NVIDIA GPU
+        result = subprocess.run(["nvidia-smi"], capture_output=True, text=True, timeout=_NVIDIA_SMI_TIMEOUT)
+        if result.returncode == 0:
+            return True
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    
+    # 可以添加其他GPU检测逻辑（AMD、Intel等）
+    return False
+
+def _release_gpu_probe(shm: shared_memory.SharedMemory):
+    """释放GPU探测共享内存"""
+    shm.close()
+    shm.unlink()
+
+def publish_shared_gpu_probe() -> bool:
+    """探测GPU并写入共享内存（由pytest控制进程在worker启动前调用，进程退出时释放）"""
+    global _published_gpu_probe
+    
+    gpu_available = _published_gpu_probe = _probe_gpu()
+    try:
+        shm = shared_memory.SharedMemory(name=_GPU_SHM_NAME, create=True, size=1)
+    except OSError:
+        # 已有其他会话发布（或无法创建），workers按各自读取结果处理
+        return gpu_available
+    shm.buf[0] = _GPU_PROBE_PRESENT if gpu_available else _GPU_PROBE_ABSENT
+    atexit.register(_release_gpu_probe, shm)
+    return gpu_available
+
+def _load_shared_gpu_probe() -> bool:
+    """读取共享的GPU探测结果
+    
+    共享内存不存在、无法访问或结果尚未写入时在本进程内探测（不创建共享内存）
+    """
+    if _published_gpu_probe is not None:
+        return _published_gpu_probe
+    
+    try:
+        shm = shared_memory.SharedMemory(name=_GPU_SHM_NAME)
+    except OSError:
+        return _probe_gpu()
+    
+    probe_state = shm.buf[0]
+    shm.close()
+    # 仅读取方不负责释放，避免resource_tracker在退出时提前unlink（POSIX下登记的名称带前导/）
+    if os.name != "nt":
+        resource_tracker.unregister(f"/{shm.name}", "shared_memory")
+    
+    if probe_state == _GPU_PROBE_PENDING:
+        return _probe_gpu()
+    return probe_state == _GPU_PROBE_PRESENT
+
+@cache
+def _gpu_available() -> bool:
+    """GPU可用性（首次使用时才读取，测试收集阶段不触发）"""
+    return _load_shared_gpu_probe()
+
+def _preconditions_key(preconditions: Dict[str, Any]) -> tuple:
+    """构建前置条件的规范化缓存键（仅包含验证涉及的字段）"""
+    platform_req = preconditions.get("platform", {})
+    resource_req = preconditions.get("resources", {})
+    return (
+        tuple(sorted(platform_req.get("required_platforms", []))),
+        tuple(sorted(platform_req.get("excluded_platforms", []))),
+        resource_req.get("min_memory_gb", 0),
+        resource_req.get("min_cpu_cores", 0),
+        resource_req.get("gpu_required", False),
+        tuple(sorted(preconditions.get("capabilities", [])))
+    )
+
 class PreconditionValidator:
     """前置条件验证器"""
     
     def __init__(self):
-        self.current_platform = self._detect_platform()
-        self.system_resources = self._get_system_resources()
-        self.available_capabilities = self._detect_capabilities()
+        # 按规范化前置条件缓存的验证结果（随验证器实例释放）
+        self._validation_cache: Dict[tuple, Dict[str, Any]] = {}
+    
+    @cached_property
+    def current_platform(self) -> str:
+        """当前平台（首次访问时检测）"""
+        return self._detect_platform()
+    
+    @cached_property
+    def system_resources(self) -> Dict[str, Any]:
+        """系统资源信息（首次访问时采集）"""
+        return self._get_system_resources()
+    
+    @cached_property
+    def available_capabilities(self) -> List[str]:
+        """可用能力（首次访问时检测）"""
+        return self._detect_capabilities()
     
     def validate_preconditions(self, preconditions: Dict[str, Any]) -> Dict[str, Any]:
         """验证前置条件"""
@@ -57,6 +162,30 @@ class PreconditionValidator:
         
         return validation_result
     
+    def validate_preconditions_cached(self, preconditions: Dict[str, Any]) -> Dict[str, Any]:
+        """验证前置条件，相同的前置条件只验证一次（返回的结果为共享对象，请勿修改）"""
+        key = _preconditions_key(preconditions)
+        result = self._validation_cache.get(key)
+        if result is None:
+            result = self._validation_cache[key] = self._validate_key(key)
+        return result
+    
+    def _validate_key(self, key: tuple) -> Dict[str, Any]:
+        """按规范化缓存键验证前置条件"""
+        required_platforms, excluded_platforms, min_memory_gb, min_cpu_cores, gpu_required, capabilities = key
+        return self.validate_preconditions({
+            "platform": {
+                "required_platforms": list(required_platforms),
+                "excluded_platforms": list(excluded_platforms)
+            },
+            "resources": {
+                "min_memory_gb": min_memory_gb,
+                "min_cpu_cores": min_cpu_cores,
+                "gpu_required": gpu_required
+            },
+            "capabilities": list(capabilities)
+        })
+    
     def _detect_platform(self) -> str:
         """检测当前平台"""
         system = platform.system().lower()
@@ -85,16 +214,7 @@ class PreconditionValidator:
     
     def _check_gpu_availability(self) -> bool:
         """检查GPU可用性"""
-        try:
-            # 尝试检测NVIDIA GPU
-            result = subprocess.run(["nvidia-smi"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return True
-        except FileNotFoundError:
-            pass
-        
-        # 可以添加其他GPU检测逻辑（AMD、Intel等）
-        return False
+        return _gpu_available()
     
     def _detect_capabilities(self) -> List[str]:
         """检测可用能力"""
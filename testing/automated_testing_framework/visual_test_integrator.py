@@ -82,66 +82,57 @@ PowerAutomation 客户端端到端视觉测试
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from enhanced_test_preconditions import EnhancedPreconditionValidator
-from powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+from testing.automated_testing_framework.powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, ALL_PLATFORMS, BASIC_RESOURCES
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("visual")
 class TestClientSideE2EVisual:
     """客户端端到端视觉测试"""
     
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = EnhancedPreconditionValidator()
         cls.visual_config = VisualTestConfig(
             browser_type="chromium",
             headless=True,
             visual_threshold=0.05
         )
         cls.visual_tester = PowerAutomationVisualTester(config=cls.visual_config)
-        
-        cls.test_config = {
-            "test_id": "CLIENT_E2E_VISUAL_001",
-            "test_name": "客户端端到端视觉测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos", "linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 4,
-                    "min_cpu_cores": 2,
-                    "gpu_required": False
-                },
+        cls.visual_tester.preload_baselines()
+        
+        cls.test_config = E2ETestConfig(
+            test_id="CLIENT_E2E_VISUAL_001",
+            test_name="客户端端到端视觉测试",
+            preconditions={
+                "platform": ALL_PLATFORMS,
+                "resources": BASIC_RESOURCES,
                 "capabilities": ["ui_test", "automation_test", "visual_test"],
                 "environment": {
                     "browser_support": "chromium"
                 },
                 "dependencies": ["playwright", "automation_engine"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, request, enhanced_validator):
+        """每个测试方法前验证前置条件并创建浏览器上下文"""
+        self.validator = enhanced_validator
         validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
             pytest.skip(f"前置条件不满足: {validation_result['reason']}")
         
-        # 启动视觉测试浏览器
-        if not self.visual_tester.start_browser():
-            pytest.skip("视觉测试浏览器启动失败")
-    
-    def teardown_method(self):
-        """每个测试方法后的清理"""
-        self.visual_tester.stop_browser()
+        # 复用会话级浏览器，每个测试只创建独立的上下文
+        self.page = self.visual_tester.new_context(request.getfixturevalue("visual_browser"))
+        
+        yield
+        
+        self.page.context.close()
     
     def test_client_ui_visual_verification(self):
         """测试客户端UI视觉验证"""
@@ -209,43 +200,34 @@ PowerAutomation 兜底自动化视觉测试
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-# 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from enhanced_test_preconditions import EnhancedPreconditionValidator
-from powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+from testing.automated_testing_framework.powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
+from testing.automated_testing_framework.end_to_end.precondition_templates import E2ETestConfig, ALL_PLATFORMS, BASIC_RESOURCES
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("visual")
 class TestFallbackAutomationVisual:
     """兜底自动化视觉测试"""
     
     @classmethod
     def setup_class(cls):
         """测试类初始化"""
-        cls.validator = EnhancedPreconditionValidator()
         cls.visual_config = VisualTestConfig(
             browser_type="chromium",
             headless=True,
             visual_threshold=0.08,  # 兜底测试允许更大的视觉差异
+            diff_downsample=4,  # 阈值较宽松，按1/16像素比较即可
             auto_update_baseline=False
         )
         cls.visual_tester = PowerAutomationVisualTester(config=cls.visual_config)
-        
-        cls.test_config = {
-            "test_id": "FALLBACK_VISUAL_001",
-            "test_name": "兜底自动化视觉测试",
-            "preconditions": {
-                "platform": {
-                    "required_platforms": ["windows", "macos", "linux"],
-                    "preferred_platforms": ["linux"],
-                    "excluded_platforms": []
-                },
-                "resources": {
-                    "min_memory_gb": 4,
-                    "min_cpu_cores": 2,
-                    "gpu_required": False
-                },
+        cls.visual_tester.preload_baselines()
+        
+        cls.test_config = E2ETestConfig(
+            test_id="FALLBACK_VISUAL_001",
+            test_name="兜底自动化视觉测试",
+            preconditions={
+                "platform": ALL_PLATFORMS,
+                "resources": BASIC_RESOURCES,
                 "capabilities": ["ui_test", "automation_test", "fallback_test", "visual_test"],
                 "environment": {
                     "browser_support": "chromium",
@@ -253,83 +235,53 @@ class TestFallbackAutomationVisual:
                 },
                 "dependencies": ["playwright", "fallback_router", "ai_engine"]
             }
-        }
+        )
     
-    def setup_method(self):
-        """每个测试方法前的设置"""
+    @pytest.fixture(autouse=True)
+    def _check_preconditions(self, request, enhanced_validator):
+        """每个测试方法前验证前置条件并创建浏览器上下文"""
+        self.validator = enhanced_validator
         validation_result = self.validator.validate_preconditions(
-            self.test_config["preconditions"]
+            self.test_config.preconditions
         )
         
         if not validation_result["valid"]:
             pytest.skip(f"前置条件不满足: {validation_result['reason']}")
         
-        if not self.visual_tester.start_browser():
-            pytest.skip("视觉测试浏览器启动失败")
-    
-    def teardown_method(self):
-        """每个测试方法后的清理"""
-        self.visual_tester.stop_browser()
-    
-    def test_trae_intervention_visual(self):
-        """测试Trae介入的视觉效果"""
-        # 模拟Trae介入场景的界面
-        test_url = "https://cursor.sh"  # Cursor编辑器官网作为示例
-        
-        result = self.visual_tester.run_visual_test(
-            test_name="trae_intervention_interface",
-            url=test_url,
-            test_id="TRAE_VISUAL_001",
-            wait_selector="main"
-        )
-        
-        assert result.passed or result.error == "基线图片已创建/更新", f"Trae介入视觉验证失败: {result.error}"
-        
-        if result.passed:
-            print(f"✅ Trae介入视觉验证通过 (差异: {result.mismatch_percentage:.2f}%)")
-        
-        # 验证Trae介入后的界面变化
-        self._verify_trae_intervention_effects(result)
-    
-    def test_manus_intervention_visual(self):
-        """测试Manus介入的视觉效果"""
-        # 模拟Manus介入场景的界面
-        test_url = "https://manus.im"  # Manus官网作为示例
-        
+        # 复用会话级浏览器，每个测试只创建独立的上下文
+        self.page = self.visual_tester.new_context(request.getfixturevalue("visual_browser"))
+        
+        yield
+        
+        self.page.context.close()
+    
+    @pytest.mark.parametrize("test_name,test_url,test_id,wait_selector,description,verify_effects", [
+        # Cursor编辑器官网作为Trae介入场景示例
+        ("trae_intervention_interface", "https://cursor.sh", "TRAE_VISUAL_001", "main",
+         "Trae介入", "_verify_trae_intervention_effects"),
+        # Manus官网作为Manus介入场景示例
+        ("manus_intervention_interface", "https://manus.im", "MANUS_VISUAL_001", "body",
+         "Manus介入", "_verify_manus_intervention_effects"),
+        # GitHub趋势页面作为数据展示示例
+        ("data_acquisition_interface", "https://github.com/trending", "DATA_VISUAL_001", ".Box-row",
+         "数据获取", "_verify_data_acquisition_effects")
+    ], ids=["trae_intervention", "manus_intervention", "data_acquisition"])
+    def test_intervention_visual(self, test_name, test_url, test_id, wait_selector, description, verify_effects):
+        """测试Trae介入、Manus介入、数据获取的视觉效果"""
         result = self.visual_tester.run_visual_test(
-            test_name="manus_intervention_interface",
+            test_name=test_name,
             url=test_url,
-            test_id="MANUS_VISUAL_001",
-            wait_selector="body"
-        )
-        
-        assert result.passed or result.error == "基线图片已创建/更新", f"Manus介入视觉验证失败: {result.error}"
-        
-        if result.passed:
-            print(f"✅ Manus介入视觉验证通过 (差异: {result.mismatch_percentage:.2f}%)")
-        
-        # 验证Manus介入后的界面变化
-        self._verify_manus_intervention_effects(result)
-    
-    def test_data_acquisition_visual(self):
-        """测试数据获取的视觉效果"""
-        # 模拟数据获取界面
-        test_url = "https://github.com/trending"  # GitHub趋势页面作为数据展示示例
-        
-        result = self.visual_tester.run_visual_test(
-            test_name="data_acquisition_interface",
-            url=test_url,
-            test_id="DATA_VISUAL_001",
-            wait_selector=".Box-row"
+            test_id=test_id,
+            wait_selector=wait_selector
         )
         
-        assert result.passed or result.error == "基线图片已创建/更新", f"数据获取视觉验证失败: {result.error}"
+        assert result.passed or result.error == "基线图片已创建/更新", f"{description}视觉验证失败: {result.error}"
         
         if result.passed:
-            print(f"✅ 数据获取视觉验证通过 (差异: {result.mismatch_percentage:.2f}%)")
+            print(f"✅ {description}视觉验证通过 (差异: {result.mismatch_percentage:.2f}%)")
         
-        # 验证数据获取后的界面变化
-        self._verify_data_acquisition_effects(result)
+        # 验证介入后的界面变化
+        getattr(self, verify_effects)(result)
     
     def test_fallback_mechanism_visual_flow(self):
         """测试兜底机制的完整视觉流程"""
@@ -475,9 +427,17 @@ from datetime import datetime
 from typing import Dict, List, Any
 
 # 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent))
+_FRAMEWORK_DIR = str(Path(__file__).parent.parent)
+if _FRAMEWORK_DIR not in sys.path:
+    sys.path.append(_FRAMEWORK_DIR)
 from powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
 
+try:
+    import xdist
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
 class VisualTestSuite:
     """视觉测试套件"""
     
@@ -577,10 +537,15 @@ class VisualTestSuite:
             "-v",
             "--tb=short",
             "--capture=no",
+            "--runslow",
             f"--html={report_file}",
             "--self-contained-html"
         ]
         
+        # 安装pytest-xdist时并行执行（视觉测试通过xdist_group固定在同一worker）
+        if XDIST_AVAILABLE:
+            pytest_args.extend(["-n", "auto", "--dist=loadgroup"])
+        
         try:
             start_time = datetime.now()
             result = pytest.main(pytest_args)
@@ -14,9 +14,17 @@ from datetime import datetime
 from typing import Dict, List, Any
 
 # 添加测试框架路径
-sys.path.append(str(Path(__file__).parent.parent))
+_FRAMEWORK_DIR = str(Path(__file__).parent.parent)
+if _FRAMEWORK_DIR not in sys.path:
+    sys.path.append(_FRAMEWORK_DIR)
 from powerautomation_visual_tester import PowerAutomationVisualTester, VisualTestConfig
 
+try:
+    import xdist
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
 class VisualTestSuite:
     """视觉测试套件"""
     
@@ -116,10 +124,15 @@ class VisualTestSuite:
             "-v",
             "--tb=short",
             "--capture=no",
+            "--runslow",
             f"--html={report_file}",
             "--self-contained-html"
         ]
         
+        # 安装pytest-xdist时并行执行（视觉测试通过xdist_group固定在同一worker）
+        if XDIST_AVAILABLE:
+            pytest_args.extend(["-n", "auto", "--dist=loadgroup"])
+        
         try:
             start_time = datetime.now()
             result = pytest.main(pytest_args)